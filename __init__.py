@@ -8,7 +8,7 @@ from pathlib import Path
 # noinspection PyPep8Naming
 def classFactory(iface):  # noqa: N802
     """Load the OpenDRIVE viewer plugin."""
-    required_packages = ["numpy", "scipy", "shapely"]
+    required_packages = ["numpy", "shapely"]
     for pkg_dependency in required_packages:
         if pkg_dependency in sys.modules or importlib.util.find_spec(pkg_dependency) is not None:
             continue
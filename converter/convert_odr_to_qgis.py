@@ -1,8 +1,9 @@
 """The main conversion functions to convert from OpenDRIVE to QGIS."""
 
+import functools
 from pathlib import Path
 
-from odrviewer.converter.global_transformer import GlobalTransformer
+from odrviewer.converter.global_transformer import BatchedGlobalTransformer
 from odrviewer.converter.lane import convert_lanes, convert_road_markings
 from odrviewer.converter.reference_frame import convert_reference_frames
 from odrviewer.converter.reference_line import convert_reference_line, convert_reference_line_segments
@@ -11,7 +12,40 @@ from odrviewer.model.projections import MERCATOR, WGS84
 from odrviewer.model.qgis_odr_map import QGISOpenDriveMap
 from odrviewer.pyxodr.road_objects.network import RoadNetwork
 from pyproj import CRS, Transformer
-from qgis.core import Qgis, QgsFeature, QgsMessageLog
+from pyproj.exceptions import CRSError
+from qgis.core import Qgis, QgsFeature, QgsFeatureSink, QgsMessageLog, QgsVectorLayer
+
+# The coordinate systems used by the plugin, parsed only once.
+_WGS84_WKT = CRS(WGS84).to_wkt()
+_MERCATOR_WKT = CRS(MERCATOR).to_wkt()
+
+
+@functools.lru_cache(maxsize=16)
+def _proj4_to_wkt_cached(proj_str: str) -> str:
+    """Parses the proj string in the header of an ODR file, and returns the coordinate system as WKT.
+
+    Maps are often loaded again with the same proj string, so this avoids parsing it with PROJ more than once.
+    """
+    return CRS.from_proj4(proj_str).to_wkt()
+
+
+@functools.lru_cache(maxsize=16)
+def _transformer_from_crs_cached(from_wkt: str, to_wkt: str, always_xy: bool) -> Transformer:
+    """Creates a pyproj transformer between two coordinate systems, given as WKT.
+
+    Setting up the PROJ pipeline is expensive, so the transformers are cached, and reused
+    whenever another map with the same coordinate system is loaded.
+    """
+    return Transformer.from_crs(CRS.from_wkt(from_wkt), CRS.from_wkt(to_wkt), always_xy=always_xy)
+
+
+def _add_features(layer: QgsVectorLayer, features: list[QgsFeature], description: str) -> None:
+    """Adds all features to a layer with a single provider call, and logs a warning if that failed."""
+    # The layers are in-memory layers, and the feature ids are never read back, so skip updating them.
+    if not layer.dataProvider().addFeatures(features, QgsFeatureSink.FastInsert):
+        QgsMessageLog.logMessage(f"failed to add {description} to QGIS map", level=Qgis.Warning)
+    # The provider changed underneath the layer, so the cached extent of the layer is outdated.
+    layer.updateExtents()
 
 
 def load_odr_map(odr_filename: Path) -> QGISOpenDriveMap:
@@ -24,18 +58,18 @@ def load_odr_map(odr_filename: Path) -> QGISOpenDriveMap:
     # convert everything to WGS-84.
     try:
         proj_str = rn.get_geometry_reference()
-        from_crs = CRS.from_proj4(proj_str)
-    except BaseException:
+        from_wkt = _proj4_to_wkt_cached(proj_str)
+    except (AttributeError, TypeError, CRSError):
         # if no proj string is set, or the proj string cannot be parsed, assume Pseudo Mercator projection (meters)
-        from_crs = MERCATOR
+        from_wkt = _MERCATOR_WKT
     try:
         x_off, y_off, z_off, heading_off = rn.get_offset()
-    except BaseException:
+    except (AttributeError, KeyError, ValueError):
         # if the offsets are not set, assume them to be 0
         x_off, y_off, z_off, _heading_off = 0, 0, 0, 0
 
-    transformer = GlobalTransformer(
-        Transformer.from_crs(crs_from=from_crs, crs_to=WGS84, always_xy=True), x_off, y_off, z_off
+    transformer = BatchedGlobalTransformer(
+        _transformer_from_crs_cached(from_wkt, _WGS84_WKT, True), x_off, y_off, z_off
     )
     ref_lines: list[QgsFeature] = []
     ref_frames: list[QgsFeature] = []
@@ -53,22 +87,14 @@ def load_odr_map(odr_filename: Path) -> QGISOpenDriveMap:
         boundaries += convert_road_markings(road, transformer)
         signals += convert_signals(road, transformer)
 
-    if not qgis_map.reference_lines.dataProvider().addFeatures(ref_lines):
-        QgsMessageLog.logMessage("failed to add reference lines to QGIS map", level=Qgis.Warning)
-
-    if not qgis_map.reference_frames.dataProvider().addFeatures(ref_frames):
-        QgsMessageLog.logMessage("failed to add reference frames to QGIS map", level=Qgis.Warning)
-
-    if not qgis_map.reference_line_segments.dataProvider().addFeatures(ref_line_segments):
-        QgsMessageLog.logMessage("failed to add reference line segments to QGIS map", level=Qgis.Warning)
-
-    if not qgis_map.lanes.dataProvider().addFeatures(lane_polygons):
-        QgsMessageLog.logMessage("failed to add road polygon to QGIS map", level=Qgis.Warning)
-
-    if not qgis_map.boundaries.dataProvider().addFeatures(boundaries):
-        QgsMessageLog.logMessage("failed to add boundaries to QGIS map", level=Qgis.Warning)
+    # The converters only queue their geometries, transform all of them to WGS-84 in one go.
+    transformer.flush()
 
-    if not qgis_map.signals.dataProvider().addFeatures(signals):
-        QgsMessageLog.logMessage("failed to add signals to QGIS map", level=Qgis.Warning)
+    _add_features(qgis_map.reference_lines, ref_lines, "reference lines")
+    _add_features(qgis_map.reference_frames, ref_frames, "reference frames")
+    _add_features(qgis_map.reference_line_segments, ref_line_segments, "reference line segments")
+    _add_features(qgis_map.lanes, lane_polygons, "road polygon")
+    _add_features(qgis_map.boundaries, boundaries, "boundaries")
+    _add_features(qgis_map.signals, signals, "signals")
 
     return qgis_map
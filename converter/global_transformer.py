@@ -1,11 +1,13 @@
 """Functions to convert local coordinates to global WGS-84 coordinates."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any, Optional
 
+import numpy as np
 import shapely
-import shapely.affinity
-import shapely.ops
+from odrviewer.geometry import shapely_geometries_to_qgs_geometries
 from pyproj import Transformer
+from qgis.core import QgsFeature
 
 
 @dataclass
@@ -24,6 +26,18 @@ class GlobalTransformer:
     # The global offset in z direction, as specified in the ODR file header.
     z_off: float
 
+    # True if the transformer maps a coordinate system to itself (e.g. the ODR file already uses WGS-84).
+    _is_identity: bool = field(init=False, repr=False)
+
+    # True if all global offsets are zero.
+    _no_offset: bool = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Detects transformations that will not change the coordinates, so that they can be skipped."""
+        source_crs = self.transformer.source_crs
+        self._is_identity = source_crs is not None and source_crs.equals(self.transformer.target_crs)
+        self._no_offset = self.x_off == 0 and self.y_off == 0 and self.z_off == 0
+
     def translate_odr_geometry(self, geometry: shapely.Geometry) -> shapely.Geometry:
         """Translates a Shapely geometry (e.g. polygon) to the global WGS-84 coordinate sytem.
 
@@ -34,5 +48,66 @@ class GlobalTransformer:
 
         Returns the translated and transformed coordinates in the WGS-84 coordinate system.
         """
-        offset_geometry = shapely.affinity.translate(geometry, self.x_off, self.y_off, self.z_off)
-        return shapely.ops.transform(self.transformer.transform, offset_geometry)
+        if self._is_identity and self._no_offset:
+            return geometry
+        return self._translate_coordinates(geometry)
+
+    def _translate_coordinates(self, geometries: Any) -> Any:
+        """Translates and transforms the coordinates of a geometry (or an array of geometries).
+
+        The offsets are added to the coordinate array in place, and the transformed coordinates are
+        written back into it, so that the coordinates are only copied out of and into the geometries once.
+        """
+        # 2D geometries get a NaN z value here, and stay 2D when the coordinates are set again.
+        coordinates = shapely.get_coordinates(geometries, include_z=True)
+        coordinates += (self.x_off, self.y_off, self.z_off)
+        if not self._is_identity:
+            # Transform all coordinates with one vectorized pyproj call, instead of one call per coordinate.
+            coordinates[:, 0], coordinates[:, 1] = self.transformer.transform(coordinates[:, 0], coordinates[:, 1])
+        return shapely.set_coordinates(geometries, coordinates)
+
+
+@dataclass
+class BatchedGlobalTransformer(GlobalTransformer):
+    """A global transformer that collects geometries, and transforms all of them at once.
+
+    Calling pyproj once per geometry is slow, because each call only transforms a handful of
+    coordinates. Instead, the converters queue their (local) geometries, and `flush` transforms
+    the coordinates of all queued geometries with a single pyproj call.
+    """
+
+    # The queued geometries (in local coordinates), and the features waiting for them.
+    _queue: list[tuple[shapely.Geometry, Optional[QgsFeature]]] = field(default_factory=list, init=False, repr=False)
+
+    def queue(self, geometry: shapely.Geometry, feature: Optional[QgsFeature] = None) -> int:
+        """Queues a geometry in local coordinates for the next `flush`.
+
+        If a feature is passed, its geometry will be set to the transformed geometry on `flush`.
+
+        Returns a token, which is the index of the transformed geometry in the list returned by `flush`.
+        """
+        self._queue.append((geometry, feature))
+        return len(self._queue) - 1
+
+    def flush(self) -> list[shapely.Geometry]:
+        """Translates and transforms all queued geometries to the global WGS-84 coordinate system.
+
+        The geometry of each feature passed to `queue` is updated. The queue is empty afterwards.
+
+        Returns the transformed geometries, in the order they were queued.
+        """
+        if not self._queue:
+            return []
+
+        geometries = np.array([geometry for geometry, _ in self._queue], dtype=object)
+        if not (self._is_identity and self._no_offset):
+            geometries = self._translate_coordinates(geometries)
+        wgs84_geometries = list(geometries)
+
+        # Convert the geometries of all features to QGIS at once.
+        has_feature = np.array([feature is not None for _, feature in self._queue])
+        features = [feature for _, feature in self._queue if feature is not None]
+        for feature, qgs_geometry in zip(features, shapely_geometries_to_qgs_geometries(geometries[has_feature])):
+            feature.setGeometry(qgs_geometry)
+        self._queue = []
+        return wgs84_geometries
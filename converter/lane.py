@@ -1,45 +1,56 @@
 """Converts an OpenDRIVE lane to a QGIS lane."""
 
 import numpy as np
+import shapely
 from odrviewer.converter.basic_types import LaneSide
-from odrviewer.converter.global_transformer import GlobalTransformer
-from odrviewer.geometry import shapely_geometry_to_qgs_geometry
+from odrviewer.converter.global_transformer import BatchedGlobalTransformer
 from odrviewer.model.qgis_odr_map import get_boundary_fields, get_lanes_fields
 from odrviewer.pyxodr.road_objects.road import Road
 from qgis.core import QgsFeature
-from shapely import LineString, Polygon
+
+# Empty features with the attributes of each layer. New features are copied from them, which is cheaper
+# than initializing the attributes from the layer fields for every single feature.
+_LANE_FEATURE = QgsFeature(get_lanes_fields())
+_BOUNDARY_FEATURE = QgsFeature(get_boundary_fields())
+
+# The names of the lane sides, as stored in the "side" attribute of the lane features.
+_LEFT_NAME = LaneSide.LEFT.name
+_RIGHT_NAME = LaneSide.RIGHT.name
 
 
 def create_lane_feature(
-    transformer: GlobalTransformer,
     road_id: int,
     lane_id: int,
-    side: LaneSide,
+    side_name: str,
     lane_index: int,
     predecessor: list[int],
     successor: list[int],
-    inner_boundary,
-    outer_boundary,
 ) -> QgsFeature:
-    """Creates a QGIS vector layer feature from an OpenDRIVE lane."""
-    lane_polygon = Polygon(np.vstack((inner_boundary, np.flip(outer_boundary, axis=0))))
-    wgs84_polygon = transformer.translate_odr_geometry(lane_polygon)
-    lane_poly_feature = QgsFeature(get_lanes_fields())
-    lane_poly_feature.setGeometry(shapely_geometry_to_qgs_geometry(wgs84_polygon))
-
-    lane_poly_feature.setAttribute("road_id", road_id)
-    lane_poly_feature.setAttribute("lane_id", lane_id)
-    lane_poly_feature.setAttribute("side", side.name)
-    lane_poly_feature.setAttribute("lane_index", lane_index)
-    lane_poly_feature.setAttribute("predecessor_ids", ", ".join(str(predecessor)))
-    lane_poly_feature.setAttribute("successor_ids", ", ".join(str(successor)))
+    """Creates a QGIS vector layer feature from an OpenDRIVE lane (without its geometry)."""
+    lane_poly_feature = QgsFeature(_LANE_FEATURE)
+
+    # Set all attributes at once, in the order of the layer fields.
+    lane_poly_feature.setAttributes(
+        [
+            road_id,
+            lane_id,
+            lane_index,
+            side_name,
+            ", ".join(map(str, predecessor)),
+            ", ".join(map(str, successor)),
+        ]
+    )
 
     return lane_poly_feature
 
 
-def convert_lanes(road: Road, transformer: GlobalTransformer) -> list[QgsFeature]:
+def convert_lanes(road: Road, transformer: BatchedGlobalTransformer) -> list[QgsFeature]:
     """Converts all lanes of a OpenDRIVE road."""
     lane_polygons: list[QgsFeature] = []
+    # The polygon ring of each lane is made of its inner boundary, followed by its reversed outer boundary.
+    # The boundaries of all lanes are collected, and all polygons of the road are created at once.
+    ring_parts: list[np.ndarray] = []
+    ring_lengths: list[int] = []
     for lane_section in road.lane_sections:
         # start processing the left lanes, if present
         inner_boundary = lane_section.lane_section_offset_line
@@ -50,17 +61,16 @@ def convert_lanes(road: Road, transformer: GlobalTransformer) -> list[QgsFeature
 
             lane_polygons.append(
                 create_lane_feature(
-                    transformer=transformer,
                     road_id=road.id,
                     lane_id=lane.id,
-                    side=LaneSide.LEFT,
+                    side_name=_LEFT_NAME,
                     lane_index=lane_index,
                     predecessor=lane.predecessor_ids,
                     successor=lane.successor_ids,
-                    inner_boundary=inner_boundary,
-                    outer_boundary=outer_boundary,
                 )
             )
+            ring_parts += (inner_boundary, outer_boundary[::-1])
+            ring_lengths.append(len(inner_boundary) + len(outer_boundary))
             # the outer boundary is the inner boundary of the next lane
             inner_boundary = outer_boundary
 
@@ -74,25 +84,32 @@ def convert_lanes(road: Road, transformer: GlobalTransformer) -> list[QgsFeature
 
             lane_polygons.append(
                 create_lane_feature(
-                    transformer=transformer,
                     road_id=road.id,
                     lane_id=lane.id,
-                    side=LaneSide.RIGHT,
+                    side_name=_RIGHT_NAME,
                     lane_index=lane_index,
                     predecessor=lane.predecessor_ids,
                     successor=lane.successor_ids,
-                    inner_boundary=inner_boundary,
-                    outer_boundary=outer_boundary,
                 )
             )
+            ring_parts += (inner_boundary, outer_boundary[::-1])
+            ring_lengths.append(len(inner_boundary) + len(outer_boundary))
 
             inner_boundary = outer_boundary
+
+    if lane_polygons:
+        ring_indices = np.repeat(np.arange(len(ring_lengths)), ring_lengths)
+        polygons = shapely.polygons(shapely.linearrings(np.concatenate(ring_parts), indices=ring_indices))
+        for lane_polygon, lane_poly_feature in zip(polygons, lane_polygons):
+            transformer.queue(lane_polygon, lane_poly_feature)
     return lane_polygons
 
 
-def convert_road_markings(road: Road, transformer: GlobalTransformer) -> list[QgsFeature]:
+def convert_road_markings(road: Road, transformer: BatchedGlobalTransformer) -> list[QgsFeature]:
     """Coverts all road markings (boundaries such as painted dashed lines into QGIS features."""
     road_markings: list[QgsFeature] = []
+    # The boundary lines are collected, and all linestrings of the road are created at once.
+    boundary_geometries: list[np.ndarray] = []
 
     for lane_section in road.lane_sections:
         for lane in lane_section.lanes:
@@ -108,25 +125,29 @@ def convert_road_markings(road: Road, transformer: GlobalTransformer) -> list[Qg
                 if boundary_geometry is None or len(boundary_geometry) < 2:
                     # drop segments that are below our pecision accuracy
                     continue
-                wgs84_boundary = transformer.translate_odr_geometry(LineString(boundary_geometry))
-
-                lane_poly_feature = QgsFeature(get_boundary_fields())
-                lane_poly_feature.setGeometry(shapely_geometry_to_qgs_geometry(wgs84_boundary))
-
-                lane_poly_feature.setAttribute("road_id", road.id)
-                lane_poly_feature.setAttribute("lane_id", lane.id)
-                lane_poly_feature.setAttribute("color", road_mark.color)
-                lane_poly_feature.setAttribute("height", road_mark.height if road_mark.height is not None else 0.0)
-                lane_poly_feature.setAttribute(
-                    "lane_change", road_mark.lane_change if road_mark.lane_change is not None else "None"
-                )
-                lane_poly_feature.setAttribute(
-                    "material", road_mark.material if road_mark.material is not None else "invalid"
+                lane_poly_feature = QgsFeature(_BOUNDARY_FEATURE)
+                boundary_geometries.append(boundary_geometry)
+
+                # Set all attributes at once, in the order of the layer fields.
+                lane_poly_feature.setAttributes(
+                    [
+                        road.id,
+                        lane.id,
+                        road_mark.color,
+                        road_mark.height if road_mark.height is not None else 0.0,
+                        road_mark.lane_change if road_mark.lane_change is not None else "None",
+                        road_mark.material if road_mark.material is not None else "invalid",
+                        road_mark.s_offset,
+                        road_mark.type,
+                        road_mark.weight if road_mark.weight is not None else 0.0,
+                        road_mark.width if road_mark.width is not None else 0.0,
+                    ]
                 )
-                lane_poly_feature.setAttribute("s_offset", road_mark.s_offset)
-                lane_poly_feature.setAttribute("type", road_mark.type)
-                lane_poly_feature.setAttribute("weight", road_mark.weight if road_mark.weight is not None else 0.0)
-                lane_poly_feature.setAttribute("width", road_mark.width if road_mark.width is not None else 0.0)
                 road_markings.append(lane_poly_feature)
 
+    if road_markings:
+        line_indices = np.repeat(np.arange(len(boundary_geometries)), [len(line) for line in boundary_geometries])
+        linestrings = shapely.linestrings(np.concatenate(boundary_geometries), indices=line_indices)
+        for linestring, lane_poly_feature in zip(linestrings, road_markings):
+            transformer.queue(linestring, lane_poly_feature)
     return road_markings
@@ -2,6 +2,7 @@
 
 from typing import Any
 
+import numpy as np
 import shapely
 from qgis.core import QgsGeometry
 from shapely.geometry import LineString
@@ -21,10 +22,31 @@ def shapely_geometry_to_qgs_geometry(shapely_geom: BaseGeometry) -> QgsGeometry:
     It uses wkb (well known binary) as the intermediate conversion step, mainly because QGIS vector layers only support
     WKT/WKB.
     """
-
     # To address https://github.com/Danaozhong/odrviewer/issues/7, we force the geometries to be 3D.
     # This will add a z dimention for 2D geometries, and will drop all dimensions > 3.
     wkb = shapely.force_3d(shapely_geom).wkb
     geometry = QgsGeometry()
     geometry.fromWkb(wkb)
     return geometry
+
+
+def shapely_geometries_to_qgs_geometries(shapely_geoms: Any) -> list[QgsGeometry]:
+    """Converts an array of Shapely geometries to QgsGeometries.
+
+    This is the same as calling `shapely_geometry_to_qgs_geometry` for each geometry, but the geometries are
+    forced to 3D and serialized to WKB with one vectorized shapely call each.
+    """
+    shapely_geoms = np.asarray(shapely_geoms, dtype=object)
+    # shapely.force_3d copies every geometry, so only apply it to the geometries that are not 3D yet.
+    is_2d = ~shapely.has_z(shapely_geoms)
+    if is_2d.all():
+        shapely_geoms = shapely.force_3d(shapely_geoms)
+    elif is_2d.any():
+        shapely_geoms = shapely_geoms.copy()
+        shapely_geoms[is_2d] = shapely.force_3d(shapely_geoms[is_2d])
+    qgs_geometries = []
+    for wkb in shapely.to_wkb(shapely_geoms):
+        geometry = QgsGeometry()
+        geometry.fromWkb(wkb)
+        qgs_geometries.append(geometry)
+    return qgs_geometries
@@ -1,137 +1,197 @@
 """This file stores the definitions of an OpenDRIVE map loaded in QGIS."""
 
-from dataclasses import dataclass, field
+from functools import lru_cache
 
+from odrviewer.model.projections import WGS84
 from PyQt5.QtCore import QVariant
-from qgis.core import QgsField, QgsFields, QgsVectorLayer
+from qgis.core import QgsCoordinateReferenceSystem, QgsField, QgsFields, QgsVectorLayer
+
+# The field types, resolved once instead of for every field. They are kept as QVariant.Type values
+# instead of plain ints, because PyQt may reject ints where QgsField expects the enum.
+_STRING, _INT, _DOUBLE, _BOOL = QVariant.String, QVariant.Int, QVariant.Double, QVariant.Bool
 
 
-@dataclass
 class QGISOpenDriveMap:
-    """A dataclass storing an OpenDRIVE map, encoded as QGIS vector layers."""
+    """A class storing an OpenDRIVE map, encoded as QGIS vector layers."""
+
+    __slots__ = ("reference_lines", "reference_line_segments", "reference_frames", "lanes", "boundaries", "signals")
+
+    def __init__(self, crs: str = WGS84) -> None:
+        """Creates the (empty) in-memory vector layers of the map, using the given coordinate system."""
+        qgs_crs = _get_crs(crs)
 
-    # All reference lines
-    reference_lines: QgsVectorLayer = field(
-        default_factory=lambda: QgsVectorLayer("LineString?crs=EPSG:4326", "reference_lines", "memory")
-    )
+        # All reference lines
+        self.reference_lines = _create_memory_layer("LineString", "reference_lines", qgs_crs)
 
-    # All reference line geometry segments
-    reference_line_segments: QgsVectorLayer = field(
-        default_factory=lambda: QgsVectorLayer("LineString?crs=EPSG:4326", "reference_line_segments", "memory")
-    )
+        # All reference line geometry segments
+        self.reference_line_segments = _create_memory_layer("LineString", "reference_line_segments", qgs_crs)
 
-    # The reference frames.
-    reference_frames: QgsVectorLayer = field(
-        default_factory=lambda: QgsVectorLayer("LineString?crs=EPSG:4326", "reference_frames", "memory")
-    )
+        # The reference frames.
+        self.reference_frames = _create_memory_layer("LineString", "reference_frames", qgs_crs)
 
-    # The lane polygons.
-    lanes: QgsVectorLayer = field(default_factory=lambda: QgsVectorLayer("Polygon?crs=EPSG:4326", "lanes", "memory"))
+        # The lane polygons.
+        self.lanes = _create_memory_layer("Polygon", "lanes", qgs_crs)
 
-    # Lane lines / boundaries
-    boundaries: QgsVectorLayer = field(
-        default_factory=lambda: QgsVectorLayer("LineString?crs=EPSG:4326", "boundaries", "memory")
-    )
+        # Lane lines / boundaries
+        self.boundaries = _create_memory_layer("LineString", "boundaries", qgs_crs)
 
-    # Signs (without geometry representation)
-    signals: QgsVectorLayer = field(default_factory=lambda: QgsVectorLayer("Point?crs=EPSG:4326", "signals", "memory"))
+        # Signs (without geometry representation)
+        self.signals = _create_memory_layer("Point", "signals", qgs_crs)
 
     def initialize_fields(self) -> None:
         """This function initializes all the data fields of each feature."""
-        initialize_fields(self.lanes, get_lanes_fields())
-        initialize_fields(self.reference_line_segments, get_reference_line_segments_fields())
-        initialize_fields(self.reference_frames, get_reference_frame_fields())
-        initialize_fields(self.boundaries, get_boundary_fields())
-        initialize_fields(self.signals, get_signal_fields())
+        initialize_fields(self.lanes, _LANES_FIELDS)
+        initialize_fields(self.reference_line_segments, _REFERENCE_LINE_SEGMENTS_FIELDS)
+        initialize_fields(self.reference_frames, _REFERENCE_FRAME_FIELDS)
+        initialize_fields(self.boundaries, _BOUNDARY_FIELDS)
+        initialize_fields(self.signals, _SIGNAL_FIELDS)
+
+
+@lru_cache(maxsize=None)
+def _get_crs(auth_id: str) -> QgsCoordinateReferenceSystem:
+    """Returns the coordinate reference system for an authority id (e.g. "EPSG:4326").
+
+    The coordinate reference system is only created once per process, instead of once for every layer of every map.
+    """
+    return QgsCoordinateReferenceSystem(auth_id)
+
+
+def _create_memory_layer(geometry_type: str, name: str, crs: QgsCoordinateReferenceSystem) -> QgsVectorLayer:
+    """Creates an empty in-memory vector layer with the given geometry type and coordinate reference system."""
+    # Set the (cached) coordinate reference system on the layer, instead of passing it in the URI, where the
+    # memory provider would parse it again for every layer.
+    layer = QgsVectorLayer(geometry_type, name, "memory")
+    layer.setCrs(crs)
+    return layer
 
 
 def initialize_fields(qgs_layer: QgsVectorLayer, fields: QgsFields) -> None:
     """Initializes a QGIS vector layer with attributes that apply for this layer."""
-    data_provider = qgs_layer.dataProvider()
-    qgs_layer.startEditing()
-    data_provider.addAttributes(fields)
-    qgs_layer.commitChanges()
+    # The memory provider does not need an edit session to change the fields, so add them to the provider
+    # directly, and only update the fields of the layer afterwards.
+    qgs_layer.dataProvider().addAttributes(fields.toList())
+    qgs_layer.updateFields()
 
 
-def get_reference_lines_fields() -> QgsFields:
-    """Gets the QGIS vector layer attributes for the reference line."""
+def _build_reference_lines_fields() -> QgsFields:
+    """Builds the attributes returned by `get_reference_lines_fields`."""
     fields = QgsFields()
-    fields.append(QgsField("id", QVariant.String))
+    fields.append(QgsField("id", _STRING))
     return fields
 
 
-def get_reference_line_segments_fields() -> QgsFields:
-    """Gets the QGIS vector layer attributes for the reference line segments."""
+def _build_reference_line_segments_fields() -> QgsFields:
+    """Builds the attributes returned by `get_reference_line_segments_fields`."""
     fields = QgsFields()
-    fields.append(QgsField("id", QVariant.String))
-    fields.append(QgsField("segment_index", QVariant.Int))
-    fields.append(QgsField("type", QVariant.String))
-    fields.append(QgsField("params", QVariant.String))
-    fields.append(QgsField("length", QVariant.Double))
-    fields.append(QgsField("heading", QVariant.Double))
-    fields.append(QgsField("xoffset", QVariant.Double))
-    fields.append(QgsField("yoffset", QVariant.Double))
+    fields.append(QgsField("id", _STRING))
+    fields.append(QgsField("segment_index", _INT))
+    fields.append(QgsField("type", _STRING))
+    fields.append(QgsField("params", _STRING))
+    fields.append(QgsField("length", _DOUBLE))
+    fields.append(QgsField("heading", _DOUBLE))
+    fields.append(QgsField("xoffset", _DOUBLE))
+    fields.append(QgsField("yoffset", _DOUBLE))
     return fields
 
 
-def get_reference_frame_fields() -> QgsFields:
-    """Gets the QGIS vector layer attributes for the reference frame (x and y coordinate system at 0/0)."""
+def _build_reference_frame_fields() -> QgsFields:
+    """Builds the attributes returned by `get_reference_frame_fields`."""
     fields = QgsFields()
-    fields.append(QgsField("id", QVariant.String))
-    fields.append(QgsField("segment_index", QVariant.Int))
-    fields.append(QgsField("axis", QVariant.String))
-    fields.append(QgsField("heading", QVariant.Double))
-    fields.append(QgsField("xoffset", QVariant.Double))
-    fields.append(QgsField("yoffset", QVariant.Double))
+    fields.append(QgsField("id", _STRING))
+    fields.append(QgsField("segment_index", _INT))
+    fields.append(QgsField("axis", _STRING))
+    fields.append(QgsField("heading", _DOUBLE))
+    fields.append(QgsField("xoffset", _DOUBLE))
+    fields.append(QgsField("yoffset", _DOUBLE))
     return fields
 
 
-def get_lanes_fields() -> QgsFields:
-    """Gets the QGIS vector layer attributes for lane polygons."""
+def _build_lanes_fields() -> QgsFields:
+    """Builds the attributes returned by `get_lanes_fields`."""
     fields = QgsFields()
-    fields.append(QgsField("road_id", QVariant.String))
-    fields.append(QgsField("lane_id", QVariant.Int))
-    fields.append(QgsField("lane_index", QVariant.String))
-    fields.append(QgsField("side", QVariant.String))
-    fields.append(QgsField("predecessor_ids", QVariant.String))
-    fields.append(QgsField("successor_ids", QVariant.String))
+    fields.append(QgsField("road_id", _STRING))
+    fields.append(QgsField("lane_id", _INT))
+    fields.append(QgsField("lane_index", _STRING))
+    fields.append(QgsField("side", _STRING))
+    fields.append(QgsField("predecessor_ids", _STRING))
+    fields.append(QgsField("successor_ids", _STRING))
     return fields
 
 
-def get_boundary_fields() -> QgsFields:
-    """Gets the QGIS vector layer attributes for boundaries (i.e. painted line, curb)."""
+def _build_boundary_fields() -> QgsFields:
+    """Builds the attributes returned by `get_boundary_fields`."""
     fields = QgsFields()
-    fields.append(QgsField("road_id", QVariant.String))
-    fields.append(QgsField("lane_id", QVariant.Int))
-    fields.append(QgsField("color", QVariant.String))
-    fields.append(QgsField("height", QVariant.Double))
-    fields.append(QgsField("lane_change", QVariant.String))
-    fields.append(QgsField("material", QVariant.String))
-    fields.append(QgsField("s_offset", QVariant.Double))
-    fields.append(QgsField("type", QVariant.String))
-    fields.append(QgsField("weight", QVariant.Double))
-    fields.append(QgsField("width", QVariant.Double))
+    fields.append(QgsField("road_id", _STRING))
+    fields.append(QgsField("lane_id", _INT))
+    fields.append(QgsField("color", _STRING))
+    fields.append(QgsField("height", _DOUBLE))
+    fields.append(QgsField("lane_change", _STRING))
+    fields.append(QgsField("material", _STRING))
+    fields.append(QgsField("s_offset", _DOUBLE))
+    fields.append(QgsField("type", _STRING))
+    fields.append(QgsField("weight", _DOUBLE))
+    fields.append(QgsField("width", _DOUBLE))
     return fields
 
 
-def get_signal_fields() -> QgsFields:
-    """Gets the QGIS vector layer attributes for signal fields (i.e. signs/traffic lights)."""
+def _build_signal_fields() -> QgsFields:
+    """Builds the attributes returned by `get_signal_fields`."""
     fields = QgsFields()
-    fields.append(QgsField("country_revision", QVariant.String))
-    fields.append(QgsField("country", QVariant.String))
-    fields.append(QgsField("dynamic", QVariant.Bool))
-    fields.append(QgsField("h_offset", QVariant.Double))
-    fields.append(QgsField("id", QVariant.String))
-    fields.append(QgsField("length", QVariant.Double))
-    fields.append(QgsField("name", QVariant.String))
-    fields.append(QgsField("orientation", QVariant.String))
-    fields.append(QgsField("pitch", QVariant.Double))
-    fields.append(QgsField("roll", QVariant.Double))
-    fields.append(QgsField("s", QVariant.Double))
-    fields.append(QgsField("subtype", QVariant.String))
-    fields.append(QgsField("t", QVariant.Double))
-    fields.append(QgsField("type", QVariant.String))
-    fields.append(QgsField("text", QVariant.String))
-    fields.append(QgsField("width", QVariant.Double))
-    fields.append(QgsField("z_offset", QVariant.Double))
+    fields.append(QgsField("country_revision", _STRING))
+    fields.append(QgsField("country", _STRING))
+    fields.append(QgsField("dynamic", _BOOL))
+    fields.append(QgsField("h_offset", _DOUBLE))
+    fields.append(QgsField("id", _STRING))
+    fields.append(QgsField("length", _DOUBLE))
+    fields.append(QgsField("name", _STRING))
+    fields.append(QgsField("orientation", _STRING))
+    fields.append(QgsField("pitch", _DOUBLE))
+    fields.append(QgsField("roll", _DOUBLE))
+    fields.append(QgsField("s", _DOUBLE))
+    fields.append(QgsField("subtype", _STRING))
+    fields.append(QgsField("t", _DOUBLE))
+    fields.append(QgsField("type", _STRING))
+    fields.append(QgsField("text", _STRING))
+    fields.append(QgsField("width", _DOUBLE))
+    fields.append(QgsField("z_offset", _DOUBLE))
     return fields
+
+
+# The attributes of the layers never change, so they are only built once. The getters return (implicitly
+# shared) copies of them, so that the cached fields can not be modified by accident.
+_REFERENCE_LINES_FIELDS = _build_reference_lines_fields()
+_REFERENCE_LINE_SEGMENTS_FIELDS = _build_reference_line_segments_fields()
+_REFERENCE_FRAME_FIELDS = _build_reference_frame_fields()
+_LANES_FIELDS = _build_lanes_fields()
+_BOUNDARY_FIELDS = _build_boundary_fields()
+_SIGNAL_FIELDS = _build_signal_fields()
+
+
+def get_reference_lines_fields() -> QgsFields:
+    """Gets the QGIS vector layer attributes for the reference line."""
+    return QgsFields(_REFERENCE_LINES_FIELDS)
+
+
+def get_reference_line_segments_fields() -> QgsFields:
+    """Gets the QGIS vector layer attributes for the reference line segments."""
+    return QgsFields(_REFERENCE_LINE_SEGMENTS_FIELDS)
+
+
+def get_reference_frame_fields() -> QgsFields:
+    """Gets the QGIS vector layer attributes for the reference frame (x and y coordinate system at 0/0)."""
+    return QgsFields(_REFERENCE_FRAME_FIELDS)
+
+
+def get_lanes_fields() -> QgsFields:
+    """Gets the QGIS vector layer attributes for lane polygons."""
+    return QgsFields(_LANES_FIELDS)
+
+
+def get_boundary_fields() -> QgsFields:
+    """Gets the QGIS vector layer attributes for boundaries (i.e. painted line, curb)."""
+    return QgsFields(_BOUNDARY_FIELDS)
+
+
+def get_signal_fields() -> QgsFields:
+    """Gets the QGIS vector layer attributes for signal fields (i.e. signs/traffic lights)."""
+    return QgsFields(_SIGNAL_FIELDS)
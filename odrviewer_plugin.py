@@ -1,17 +1,72 @@
 """This file contains a plugin for QGIS to load and visualize OpenDRIVE maps."""
 
 import os.path
+import traceback
 from pathlib import Path
 from typing import Optional
 
 from odrviewer.converter.convert_odr_to_qgis import load_odr_map
-from odrviewer.styling.apply_qgis_styles import apply_qgis_styles
-from qgis.core import Qgis, QgsLayerTreeGroup, QgsMessageLog, QgsProject, QgsVectorLayer
+from odrviewer.model.qgis_odr_map import QGISOpenDriveMap
+from odrviewer.styling.apply_qgis_styles import apply_qgis_styles, clear_style_caches
+from qgis.core import Qgis, QgsApplication, QgsLayerTreeGroup, QgsMessageLog, QgsProject, QgsTask, QgsVectorLayer
 from qgis.PyQt.QtCore import QCoreApplication
 from qgis.PyQt.QtGui import QIcon
 from qgis.PyQt.QtWidgets import QAction, QFileDialog
 
 
+class LoadOpenDriveMapTask(QgsTask):
+    """A background task to load an OpenDRIVE map, without blocking the QGIS user interface."""
+
+    def __init__(self, odr_filename: Path, plugin: "OpenDriveViewer"):
+        """Constructor."""
+        super().__init__(f"Loading OpenDRIVE map {odr_filename.name}")
+        self.odr_filename = odr_filename
+        self.plugin = plugin
+        self.qgis_map: Optional[QGISOpenDriveMap] = None
+        # The exception raised while loading the map. Exceptions can not propagate out of the background thread,
+        # so it is reported in `finished`.
+        self.exception: Optional[Exception] = None
+
+    def run(self) -> bool:
+        """Loads the map. This runs in a background thread."""
+        try:
+            qgis_map = load_odr_map(self.odr_filename)
+        except Exception as e:
+            self.exception = e
+            return False
+        if self.isCanceled():
+            return False
+
+        # The layers were created in this thread, but they will be added to the project in the main thread.
+        main_thread = QCoreApplication.instance().thread()
+        for layer in (
+            qgis_map.reference_lines,
+            qgis_map.reference_line_segments,
+            qgis_map.reference_frames,
+            qgis_map.lanes,
+            qgis_map.boundaries,
+            qgis_map.signals,
+        ):
+            layer.moveToThread(main_thread)
+        self.qgis_map = qgis_map
+        return True
+
+    def finished(self, result: bool) -> None:
+        """Adds the loaded map to QGIS. This runs in the main thread, once `run` is done."""
+        self.plugin.load_tasks.discard(self)
+        if result and self.qgis_map is not None:
+            self.plugin.on_map_loaded(self.odr_filename, self.qgis_map)
+        elif self.exception is not None:
+            message = f"failed to load map {self.odr_filename}: {self.exception!r}"
+            QgsMessageLog.logMessage(
+                "".join(traceback.format_exception(type(self.exception), self.exception, self.exception.__traceback__)),
+                level=Qgis.Critical,
+            )
+            self.plugin.iface.messageBar().pushMessage("OpenDRIVE Viewer", message, level=Qgis.Critical)
+        else:
+            QgsMessageLog.logMessage(f"loading map {self.odr_filename} was canceled", level=Qgis.Info)
+
+
 class OpenDriveViewer:
     """This class represents a plugin for QGIS to load and visualize OpenDRIVE maps."""
 
@@ -26,6 +81,9 @@ class OpenDriveViewer:
         self.actions = []
         self.menu = self.tr("&OpenDRIVE Viewer")
 
+        # The tasks loading maps in the background. References are kept, so that they are not garbage collected.
+        self.load_tasks: set[LoadOpenDriveMapTask] = set()
+
     # noinspection PyMethodMayBeStatic
     def tr(self, message):
         """Get the translation for a string using Qt translation API.
@@ -118,11 +176,15 @@ class OpenDriveViewer:
             callback=self.open_map,
             parent=self.iface.mainWindow(),
         )
+        # The cached styles are created from the default symbols of the project, drop them with the project.
+        QgsProject.instance().cleared.connect(clear_style_caches)
 
     def unload(self):
         """Removes the plugin menu item and icon from QGIS GUI."""
         for action in self.actions:
             self.iface.removePluginVectorMenu(self.tr("&OpenDRIVE Viewer"), action)
+        QgsProject.instance().cleared.disconnect(clear_style_caches)
+        clear_style_caches()
 
     def show_file_dialog(self) -> Optional[str]:
         """Opens a window to select an OpenDRIVE file to open."""
@@ -145,27 +207,32 @@ class OpenDriveViewer:
             print("No file selected")
             return
 
-        odr_filename = Path(odr_filename_str)
-        try:
-            # Try to load the map.
-            qgis_map = load_odr_map(odr_filename)
-
-        except AssertionError as e:
-            print(f"failed to load map: {e}")
-            return
+        # Load the map in the background, the layers are added once it is done (see `on_map_loaded`).
+        load_task = LoadOpenDriveMapTask(Path(odr_filename_str), self)
+        self.load_tasks.add(load_task)
+        QgsApplication.taskManager().addTask(load_task)
 
+    def on_map_loaded(self, odr_filename: Path, qgis_map: QGISOpenDriveMap) -> None:
+        """Adds the layers of a loaded OpenDRIVE map to QGIS."""
         # The map was loaded successfully, transfer the ownership of the vector layers to QGIS
         apply_qgis_styles(qgis_map)
         map_name = odr_filename.stem
 
         current_map_group = QgsProject.instance().layerTreeRoot().addGroup(f"ODR_{map_name}")
 
-        self.load_layer(qgis_map.signals, "signals", current_map_group)
-        self.load_layer(qgis_map.boundaries, "boundaries", current_map_group)
-        self.load_layer(qgis_map.reference_lines, "reference_lines", current_map_group)
-        self.load_layer(qgis_map.reference_line_segments, "reference_line_segments", current_map_group, False)
-        self.load_layer(qgis_map.reference_frames, "reference_frames", current_map_group, False)
-        self.load_layer(qgis_map.lanes, "lanes", current_map_group)
+        # Freeze the map canvas while adding the layers, so that it is only redrawn once all of them are added.
+        canvas = self.iface.mapCanvas()
+        canvas.freeze(True)
+        try:
+            self.load_layer(qgis_map.signals, "signals", current_map_group)
+            self.load_layer(qgis_map.boundaries, "boundaries", current_map_group)
+            self.load_layer(qgis_map.reference_lines, "reference_lines", current_map_group)
+            self.load_layer(qgis_map.reference_line_segments, "reference_line_segments", current_map_group, False)
+            self.load_layer(qgis_map.reference_frames, "reference_frames", current_map_group, False)
+            self.load_layer(qgis_map.lanes, "lanes", current_map_group)
+        finally:
+            canvas.freeze(False)
+            canvas.refresh()
 
     def load_layer(self, qgis_layer: QgsVectorLayer, name: str, group: QgsLayerTreeGroup, visible=True) -> None:
         """Adds a QGIS vector layer into QGIS. It will log an error if loading failed."""
@@ -1,102 +1,143 @@
-"""This file contains all enumeration types specified in OpenDRIVE."""
+"""This file contains all enumeration types specified in OpenDRIVE.
 
-from enum import Enum
+The values are read as strings from the XML attributes, so the enumerations are plain namespaces of string
+constants. Comparing a parsed value against a constant is a plain string comparison, and `ALL` contains all
+valid values of an enumeration.
+"""
 
+from typing import Final
 
-class RoadMarkColor(str, Enum):
+
+class RoadMarkColor:
     """Enumeration for the color of road markings."""
 
-    INVALID = "invalid"
-    BLACK = "black"
-    BLUE = "blue"
-    GREEN = "green"
-    ORANGE = "orange"
-    RED = "red"
-    STANDARD = "standard"
-    WHITE = "white"
-    VIOLET = "violet"
-    YELLOW = "yellow"
+    INVALID: Final = "invalid"
+    BLACK: Final = "black"
+    BLUE: Final = "blue"
+    GREEN: Final = "green"
+    ORANGE: Final = "orange"
+    RED: Final = "red"
+    STANDARD: Final = "standard"
+    WHITE: Final = "white"
+    VIOLET: Final = "violet"
+    YELLOW: Final = "yellow"
+
+    ALL: Final = frozenset((INVALID, BLACK, BLUE, GREEN, ORANGE, RED, STANDARD, WHITE, VIOLET, YELLOW))
 
 
-class RoadMarkType(str, Enum):
+class RoadMarkType:
     """Enumeration for road marking types."""
 
-    INVALID = "invalid"
-    BOTTS_DOTS = "botts dots"
-    BROKEN_BROKEN = "broken broken"
-    BROKEN_SOLID = "broken solid"
-    BROKEN = "broken"
-    CURB = "curb"
-    CUSTOM = "custom"
-    edge = "edge"
-    GRASS = "grass"
-    NONE = "none"
-    SOLID_BROKEN = "solid broken"
-    SOLID_SOLID = "solid solid"
-    SOLID = "solid"
-
-
-class LaneChange(str, Enum):
+    INVALID: Final = "invalid"
+    BOTTS_DOTS: Final = "botts dots"
+    BROKEN_BROKEN: Final = "broken broken"
+    BROKEN_SOLID: Final = "broken solid"
+    BROKEN: Final = "broken"
+    CURB: Final = "curb"
+    CUSTOM: Final = "custom"
+    edge: Final = "edge"
+    GRASS: Final = "grass"
+    NONE: Final = "none"
+    SOLID_BROKEN: Final = "solid broken"
+    SOLID_SOLID: Final = "solid solid"
+    SOLID: Final = "solid"
+
+    ALL: Final = frozenset(
+        (
+            INVALID,
+            BOTTS_DOTS,
+            BROKEN_BROKEN,
+            BROKEN_SOLID,
+            BROKEN,
+            CURB,
+            CUSTOM,
+            edge,
+            GRASS,
+            NONE,
+            SOLID_BROKEN,
+            SOLID_SOLID,
+            SOLID,
+        )
+    )
+
+
+class LaneChange:
     """Enumeration for lane change types."""
 
-    INVALID = "invalid"
-    BOTH = "both"
-    DECREASE = "decrease"
-    INCREASE = "increase"
-    NONE = "none"
+    INVALID: Final = "invalid"
+    BOTH: Final = "both"
+    DECREASE: Final = "decrease"
+    INCREASE: Final = "increase"
+    NONE: Final = "none"
 
+    ALL: Final = frozenset((INVALID, BOTH, DECREASE, INCREASE, NONE))
 
-class Orientation(str, Enum):
+
+class Orientation:
     """Enumeration for orientation (relative to something else)."""
 
-    PLUS = "+"
-    MINUS = "-"
-    NONE = "none"
+    PLUS: Final = "+"
+    MINUS: Final = "-"
+    NONE: Final = "none"
+
+    ALL: Final = frozenset((PLUS, MINUS, NONE))
 
 
-class UnitDistance(str, Enum):
+class UnitDistance:
     """Enumeration for distance units."""
 
-    FOOT = "ft"
-    KILOMETER = "km"
-    METER = "m"
-    MILE = "mile"
+    FOOT: Final = "ft"
+    KILOMETER: Final = "km"
+    METER: Final = "m"
+    MILE: Final = "mile"
 
+    ALL: Final = frozenset((FOOT, KILOMETER, METER, MILE))
 
-class UnitSpeed(str, Enum):
+
+class UnitSpeed:
     """Enumeration for speed units."""
 
-    KM_PER_HOUR = "km/h"
-    METER_PER_SECOND = "m/s"
-    MILES_PER_HOUR = "mph"
+    KM_PER_HOUR: Final = "km/h"
+    METER_PER_SECOND: Final = "m/s"
+    MILES_PER_HOUR: Final = "mph"
+
+    ALL: Final = frozenset((KM_PER_HOUR, METER_PER_SECOND, MILES_PER_HOUR))
 
 
-class UnitMass(str, Enum):
+class UnitMass:
     """Enumeration for mass units."""
 
-    KILOGRAM = "kg"
-    TON = "t"
+    KILOGRAM: Final = "kg"
+    TON: Final = "t"
 
+    ALL: Final = frozenset((KILOGRAM, TON))
 
-class UnitSlope(str, Enum):
+
+class UnitSlope:
     """Enumeration for slope units."""
 
-    PERCENT = "%"
+    PERCENT: Final = "%"
+
+    ALL: Final = frozenset((PERCENT,))
 
 
 CountryCode = str
 
 
-class Unit(str, Enum):
+class Unit:
     """An enumeration of all units (speed, distance, slope, mass)."""
 
-    FOOT = "ft"
-    KILOMETER = "km"
-    METER = "m"
-    MILE = "mile"
-    KM_PER_HOUR = "km/h"
-    METER_PER_SECOND = "m/s"
-    MILES_PER_HOUR = "mph"
-    KILOGRAM = "kg"
-    TON = "t"
-    PERCENT = "%"
+    FOOT: Final = "ft"
+    KILOMETER: Final = "km"
+    METER: Final = "m"
+    MILE: Final = "mile"
+    KM_PER_HOUR: Final = "km/h"
+    METER_PER_SECOND: Final = "m/s"
+    MILES_PER_HOUR: Final = "mph"
+    KILOGRAM: Final = "kg"
+    TON: Final = "t"
+    PERCENT: Final = "%"
+
+    ALL: Final = frozenset(
+        (FOOT, KILOMETER, METER, MILE, KM_PER_HOUR, METER_PER_SECOND, MILES_PER_HOUR, KILOGRAM, TON, PERCENT)
+    )
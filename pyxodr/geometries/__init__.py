@@ -6,4 +6,4 @@ from odrviewer.pyxodr.geometries.line import Line
 from odrviewer.pyxodr.geometries.multi import MultiGeom
 from odrviewer.pyxodr.geometries.spiral import Spiral
 
-__all__ = [Arc, CubicPolynom, ParamCubicPolynom, Line, MultiGeom, Spiral]
+__all__ = ["Arc", "CubicPolynom", "ParamCubicPolynom", "Line", "MultiGeom", "Spiral"]
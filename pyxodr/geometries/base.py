@@ -5,10 +5,10 @@ These include x and y offsets, heading offset and a length parameter.
 
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Optional
+from typing import Optional, Sequence
 
 import numpy as np
-from odrviewer.pyxodr.utils.array import fix_zero_directions
+from odrviewer.pyxodr.utils.array import fix_zero_directions, row_norms
 
 
 class GeometryType(Enum):
@@ -25,6 +25,8 @@ class GeometryType(Enum):
 class Geometry(ABC):
     """Base class for geometry objects."""
 
+    __slots__ = ("geometry_type", "x_offset", "y_offset", "heading_offset", "length")
+
     def __init__(
         self,
         geometry_type: GeometryType,
@@ -94,9 +96,7 @@ class Geometry(ABC):
 
         The resolution specifies the distance along u, on which to create a shape point.
         """
-        num_samples = max(int(self.length / resolution), 2)
-
-        offsets = self(np.linspace(0.0, self.length, num_samples))
+        offsets = self(np.linspace(0.0, self.length, self._num_samples(resolution)))
         return Geometry.global_coords_from_offsets(
             offsets,
             self.x_offset,
@@ -104,6 +104,51 @@ class Geometry(ABC):
             self.heading_offset,
         )
 
+    @staticmethod
+    def evaluate_geometries(geometries: Sequence["Geometry"], resolution: float) -> np.ndarray:
+        """Evaluates a sequence of geometries, and stacks their shape points in the global frame.
+
+        Gives the same shape points as stacking `evaluate_geometry` of each geometry, but the rotation and
+        translation to the global frame is applied to the local coordinates of all geometries at once.
+
+        Parameters
+        ----------
+        geometries : Sequence[Geometry]
+            Geometries to evaluate, in the order in which their shape points are stacked.
+        resolution : float
+            Distance along u, on which to create a shape point.
+
+        Returns:
+        -------
+        np.ndarray
+            Shape points of all geometries in the global frame, [N, 2].
+        """
+        # The number of shape points of each geometry is known up front, so each geometry writes its local
+        # coordinates straight into its slice of one preallocated array.
+        num_samples = [geometry._num_samples(resolution) for geometry in geometries]
+        ends = np.cumsum(num_samples)
+        local_coords = np.empty((ends[-1], 2), dtype=np.float64)
+        for geometry, n, end in zip(geometries, num_samples, ends.tolist()):
+            local_coords[end - n : end] = geometry(np.linspace(0.0, geometry.length, n))
+
+        # Repeat the offsets of each geometry for all of its shape points.
+        x_offsets, y_offsets, heading_offsets = np.repeat(
+            np.array([[geometry.x_offset, geometry.y_offset, geometry.heading_offset] for geometry in geometries]).T,
+            num_samples,
+            axis=1,
+        )
+        c, s = np.cos(heading_offsets), np.sin(heading_offsets)
+        u, v = local_coords[:, 0], local_coords[:, 1]
+
+        global_coords = np.empty_like(local_coords)
+        global_coords[:, 0] = c * u - s * v + x_offsets
+        global_coords[:, 1] = s * u + c * v + y_offsets
+        return global_coords
+
+    def _num_samples(self, resolution: float) -> int:
+        """Returns the number of shape points `evaluate_geometry` creates at the given resolution."""
+        return max(int(self.length / resolution), 2)
+
     @staticmethod
     def compute_offset_vectors(
         local_offsets: np.ndarray,
@@ -159,9 +204,7 @@ class Geometry(ABC):
         # replace any all-zero rows
         perpendicular_directions = fix_zero_directions(perpendicular_directions)
         # Unit scale
-        scaled_perpendicular_directions_t = perpendicular_directions.T / np.linalg.norm(
-            perpendicular_directions, axis=1
-        )
+        scaled_perpendicular_directions_t = perpendicular_directions.T / row_norms(perpendicular_directions)
 
         offsets = (local_offsets * scaled_perpendicular_directions_t).T
 
@@ -215,14 +258,12 @@ class NullGeometry(Geometry):
 
     def __call__(self, p_array: np.ndarray) -> np.ndarray:
         r"""Return $(p, 0.0) \forall p \in p_array$."""
-        v_array = np.zeros(len(p_array))
-
-        local_coords = np.stack((p_array, v_array), axis=1)
+        local_coords = np.zeros((len(p_array), 2))
+        local_coords[:, 0] = p_array
         return local_coords
 
     def u_v_from_u(self, u_array: np.ndarray) -> np.ndarray:
         r"""Return $(u, 0.0) \forall u \in u_array$."""
-        v_array = np.zeros(len(u_array))
-
-        local_coords = np.stack((u_array, v_array), axis=1)
+        local_coords = np.zeros((len(u_array), 2))
+        local_coords[:, 0] = u_array
         return local_coords
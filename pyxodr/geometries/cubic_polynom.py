@@ -1,10 +1,109 @@
 """Functions to process OpenDRIVE cubic polynomials geometries."""
 
+from functools import lru_cache
 from typing import Optional
 
 import numpy as np
 from odrviewer.pyxodr.geometries.base import Geometry, GeometryType
-from scipy.integrate import solve_ivp
+
+# The minimum number of samples used to integrate the arc length of a cubic polynomial.
+_MIN_ARC_LENGTH_SAMPLES = 1024
+
+
+def _ds_du(u_array: np.ndarray, b: float, c: float, d: float) -> np.ndarray:
+    r"""Return the arc length element ds / du of a cubic polynomial at an array of u coordinates.
+
+    Computes
+    $$\frac{ds}{du} = \sqrt{1 + \left ( \frac{dv}{du} \right )^2}$$
+    Where
+    $$v(u) = a + bu + cu^2 + du^3$$
+
+    Parameters
+    ----------
+    u_array : np.ndarray
+        u values at which to compute ds / du.
+    b : float
+        b parameter of the polynomial.
+    c : float
+        c parameter of the polynomial.
+    d : float
+        d parameter of the polynomial.
+
+    Returns:
+    -------
+    np.ndarray
+        Array of ds / du values.
+    """
+    # Horner's scheme for dv/du = b + 2cu + 3du^2, with plain multiplications instead of np.power.
+    dv_du = b + u_array * (2.0 * c + u_array * (3.0 * d))
+    dv_du *= dv_du
+    dv_du += 1.0
+    return np.sqrt(dv_du)
+
+
+def _evaluate_polynomial_into(out: np.ndarray, u_array: np.ndarray, a: float, b: float, c: float, d: float) -> None:
+    """Evaluate $v(u) = a + bu + cu^2 + du^3$ into an existing array.
+
+    Uses Horner's scheme with in-place operations, so no temporary arrays are allocated.
+
+    Parameters
+    ----------
+    out : np.ndarray
+        Array (or array view, e.g. a column) to write the v values to, of the same length as u_array.
+    u_array : np.ndarray
+        u values at which to evaluate the polynomial.
+    a : float
+        a parameter of the polynomial.
+    b : float
+        b parameter of the polynomial.
+    c : float
+        c parameter of the polynomial.
+    d : float
+        d parameter of the polynomial.
+    """
+    out[:] = d
+    out *= u_array
+    out += c
+    out *= u_array
+    out += b
+    out *= u_array
+    out += a
+
+
+@lru_cache(maxsize=256)
+def _solve_arc_length(b: float, c: float, d: float, s_bytes: bytes) -> np.ndarray:
+    """Return the u values of a cubic polynomial at the given distances along the polynomial curve.
+
+    See `CubicPolynom._u_array_from_arc_lengths`.
+
+    Parameters
+    ----------
+    b : float
+        b parameter of the polynomial.
+    c : float
+        c parameter of the polynomial.
+    d : float
+        d parameter of the polynomial.
+    s_bytes : bytes
+        Raw bytes of the float64 array of (non-negative) distances along the polynomial curve; bytes are
+        hashable, so they can be used as a cache key.
+
+    Returns:
+    -------
+    np.ndarray
+        Read-only array of u values corresponding to these distances.
+    """
+    s_array = np.frombuffer(s_bytes, dtype=np.float64)
+    # ds/du >= 1, so u(s) <= s, and a grid of u values up to the largest s covers all of s_array.
+    u_dense = np.linspace(0.0, s_array.max(), max(_MIN_ARC_LENGTH_SAMPLES, 4 * len(s_array)))
+    ds_du = _ds_du(u_dense, b, c, d)
+    s_dense = np.empty_like(u_dense)
+    s_dense[0] = 0.0
+    np.cumsum(0.5 * (ds_du[1:] + ds_du[:-1]) * np.diff(u_dense), out=s_dense[1:])
+    u_array = np.interp(s_array, s_dense, u_dense)
+    # The array is shared by all callers of the cache.
+    u_array.flags.writeable = False
+    return u_array
 
 
 class CubicPolynom(Geometry):
@@ -27,6 +126,8 @@ class CubicPolynom(Geometry):
         method of this class will be unusable)
     """
 
+    __slots__ = ("a", "b", "c", "d", "_degree")
+
     def __init__(
         self,
         a: float,
@@ -41,6 +142,18 @@ class CubicPolynom(Geometry):
         """Creates a cubic polynomial OpenDRIVE geometry object."""
         Geometry.__init__(self, GeometryType.CUBIC_POLYNOM, x_offset, y_offset, heading_offset, length)
         self.a, self.b, self.c, self.d = a, b, c, d
+        # Most lane widths are constant or linear, so u_v_from_u evaluates only the terms that are not zero.
+        self._degree = 3 if d != 0.0 else 2 if c != 0.0 else 1 if b != 0.0 else 0
+
+    @classmethod
+    def get(cls, a: float, b: float, c: float, d: float, length: Optional[float] = None) -> "CubicPolynom":
+        """Return a (shared) cubic polynomial without offsets for the given parameters.
+
+        Many lanes share the same width profile (e.g. constant width lanes), so the polynomials are cached by
+        their parameters instead of creating a new object for every lane. The returned object must not be
+        modified.
+        """
+        return _get_cubic_polynom(a, b, c, d, length)
 
     def __call__(self, p_array: np.ndarray) -> np.ndarray:
         r"""Return local (p, v) coordinates from an array of parameter $p \in [0.0, 1.0]$.
@@ -62,45 +175,15 @@ class CubicPolynom(Geometry):
         local_coords = self.u_v_from_u(u_array)
         return local_coords
 
-    def _du_ds_differential_equation(self, _: float, y: np.ndarray) -> np.ndarray:
-        r"""Differential equation for use in the solving of u from s.
-
-        Solves the equation
-        $$\frac{du}{ds} = \frac{1}{\sqrt{1 + \left ( \frac{dv}{du} \right ) }}$$
-        Where for this class
-        $$v(u) = a + bu + cu^2 + du^3$$
-
-        Parameters
-        ----------
-        _ : float
-            Present to fit the function signature required by scipy's solve_ivp
-        y : np.ndarray
-            Array of K 1D y values, [1, K]. Note y here refers to the
-            scipy.integrate.solve_ivp spec; for our use case, y == u.
-
-        Returns:
-        -------
-        np.ndarray
-            Array of dy /dt (for our purposes, du / ds) values, [1, K]
-        """
-        y = y.T.squeeze()
-        dv_du = np.ones_like(y) * self.b + 2 * self.c * y + 3 * self.d * np.power(y, 2)
-        result = np.power(np.ones_like(y) + np.power(dv_du, 2), -0.5)
-        return result.T
-
     def _u_array_from_arc_lengths(self, s_array: np.ndarray) -> np.ndarray:
         r"""Return an array of u (local coord) from s (distance along geometry).
 
         Required as OpenDRIVE provides a length value for road reference lines (i.e.
         a max s value) but the cubic polynomial geometry is parameterised by u (see
-        7.6.2). Converting between them is done here by solving the initial value
-        problem of the equation
-        $$\frac{du}{ds} = \frac{1}{\sqrt{1 + \left ( \frac{dv}{du} \right ) }}$$
-        with
-        $$s_0 = 0$$
-        $$u(s_0) = 0$$
-        This seems convoluted so it's possible I've misunderstood the spec here;
-        please raise an issue if so.
+        7.6.2). Converting between them is done here by inverting the arc length
+        $$s(u) = \int_0^u \sqrt{1 + \left ( \frac{dv}{du} \right )^2} du$$
+        which is monotonically increasing in u. s(u) is integrated with the trapezoidal
+        rule on a dense grid of u values, and u(s) is interpolated from that grid.
 
         Parameters
         ----------
@@ -112,19 +195,16 @@ class CubicPolynom(Geometry):
         np.ndarray
             Array of u values corresponding to these distances.
         """
+        s_array = np.asarray(s_array, dtype=np.float64)
         if min(s_array) != 0.0:
             raise ValueError(f"s_array contains negative values: {s_array}")
-        solution = solve_ivp(
-            self._du_ds_differential_equation,
-            (0.0, max(s_array)),
-            np.array([0.0]),
-            t_eval=s_array,
-            vectorized=True,
-        )
-        if not (s_array == solution.t).all():
-            raise RuntimeError("failed to solve the differential equation")
-        u_array = solution.y.squeeze()
-        return u_array
+        if self._degree <= 1:
+            # v(u) is linear, so du/ds is constant and u(s) has a closed form; no need to integrate.
+            return s_array / np.sqrt(1.0 + self.b * self.b)
+
+        # The same geometry is evaluated more than once (e.g. for the reference line and for its segments),
+        # so the (read-only) solution is cached for the coefficients and distances.
+        return _solve_arc_length(self.b, self.c, self.d, s_array.tobytes())
 
     def u_v_from_p(self, p_array: np.ndarray) -> np.ndarray:
         r"""Return local (p, v) coordinates from an array of parameter $p \in [0.0, 1.0]$.
@@ -161,14 +241,15 @@ class CubicPolynom(Geometry):
         np.ndarray
             Array of local (u, v) coordinate pairs.
         """
-        v_array = (
-            self.a * np.ones_like(u_array)
-            + self.b * u_array
-            + self.c * np.power(u_array, 2)
-            + self.d * np.power(u_array, 3)
-        )
-
-        local_coords = np.stack((u_array, v_array), axis=1)
+        local_coords = np.empty((len(u_array), 2), dtype=np.float64)
+        local_coords[:, 0] = u_array
+        if self._degree == 0:
+            local_coords[:, 1] = self.a
+        elif self._degree == 1:
+            np.multiply(u_array, self.b, out=local_coords[:, 1])
+            local_coords[:, 1] += self.a
+        else:
+            _evaluate_polynomial_into(local_coords[:, 1], u_array, self.a, self.b, self.c, self.d)
 
         return local_coords
 
@@ -220,8 +301,8 @@ class ParamCubicPolynom(Geometry):
         # From the OpenDRIVE spec (7.7.1) we can use the call function from the
         # CubicPolynom class above but parameterized over the range [0,1]. We can
         # achieve this by setting the length of these curves to 1.0.
-        self.p_u = CubicPolynom(a_u, b_u, c_u, d_u, length=1.0)
-        self.p_v = CubicPolynom(a_v, b_v, c_v, d_v, length=1.0)
+        self.p_u = CubicPolynom.get(a_u, b_u, c_u, d_u, length=1.0)
+        self.p_v = CubicPolynom.get(a_v, b_v, c_v, d_v, length=1.0)
 
     def __call__(self, p_array: np.ndarray) -> np.ndarray:
         r"""Return local (u, v) coordinates from an array of parameter $p \in [0.0, 1.0]$.
@@ -239,10 +320,12 @@ class ParamCubicPolynom(Geometry):
         np.ndarray
             Array of local (u, v) coordinate pairs.
         """
-        u_array = self.p_u.u_v_from_p(p_array)[:, 1]
-        v_array = self.p_v.u_v_from_p(p_array)[:, 1]
-
-        local_coords = np.stack((u_array, v_array), axis=1)
+        # Both polynomials have a length of 1.0, so they are evaluated at p directly, and written into the
+        # columns of the output array instead of stacking the v columns of two (u, v) arrays.
+        p_u, p_v = self.p_u, self.p_v
+        local_coords = np.empty((len(p_array), 2), dtype=np.float64)
+        _evaluate_polynomial_into(local_coords[:, 0], p_array, p_u.a, p_u.b, p_u.c, p_u.d)
+        _evaluate_polynomial_into(local_coords[:, 1], p_array, p_v.a, p_v.b, p_v.c, p_v.d)
         return local_coords
 
     def u_v_from_u(self, u_array: np.ndarray) -> np.ndarray:
@@ -252,3 +335,9 @@ class ParamCubicPolynom(Geometry):
     def __str__(self) -> str:
         """string-readable export of the polynomial."""
         return f"pU=[{str(self.p_u)}], pV=[{str(self.p_v)}]"
+
+
+@lru_cache(maxsize=4096)
+def _get_cubic_polynom(a: float, b: float, c: float, d: float, length: Optional[float]) -> CubicPolynom:
+    """Return the cached cubic polynomial returned by `CubicPolynom.get`."""
+    return CubicPolynom(a, b, c, d, length=length)
@@ -46,10 +46,11 @@ class Line(Geometry):
         np.ndarray
             Array of local (u, v) coordinate pairs.
         """
-        # Construct direction vector
-        direction_vector = np.array([1.0, 0.0])
-        direction_tensor = np.tile(direction_vector, (len(p_array), 1))
-        return (direction_tensor.T * p_array).T
+        # The line runs along the x axis, so u is p and v is zero. Write p into a zeroed output array,
+        # instead of scaling a tiled direction vector, which needs two more temporary arrays.
+        local_coords = np.zeros((len(p_array), 2))
+        local_coords[:, 0] = p_array
+        return local_coords
 
     def u_v_from_u(self, u_array: np.ndarray) -> np.ndarray:
         """Raise an error; this geometry is parametric with no v from u method."""
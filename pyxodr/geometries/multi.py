@@ -1,10 +1,13 @@
 """Contains classes and functions to store multiple geometries (line, arc, spiral) combined together."""
 
 from copy import deepcopy
-from typing import List
+from typing import List, Optional, Tuple
 
 import numpy as np
 from odrviewer.pyxodr.geometries.base import Geometry, NullGeometry
+from odrviewer.pyxodr.geometries.cubic_polynom import CubicPolynom
+from odrviewer.pyxodr.utils import cached_property
+from odrviewer.pyxodr.utils.array import row_norms
 
 
 class MultiGeom:
@@ -65,18 +68,46 @@ class MultiGeom:
 
         du_values = u_array - self.distance_array[geometry_indices]
 
-        v_values = []
-
+        # Write u and the v values of each geometry into one contiguous float64 array, instead of stacking them.
+        local_coords = np.empty((len(u_array), 2), dtype=np.float64)
+        local_coords[:, 0] = u_array
+
+        if self._cubic_coefficients is not None:
+            # Elevations and lane offsets are cubic polynomials, so evaluate all u values in a single (in-place)
+            # Horner pass, with the coefficients of the geometry of each u value.
+            if len(u_array) != 0 and geometry_indices.min() < 0:
+                raise ValueError("Not all u values are covered by a geometry.")
+            a, b, c, d = self._cubic_coefficients[geometry_indices].T
+            v_values = local_coords[:, 1]
+            np.multiply(d, du_values, out=v_values)
+            v_values += c
+            v_values *= du_values
+            v_values += b
+            v_values *= du_values
+            v_values += a
+            return local_coords
+
+        v_start = 0
         for geometry_index, geometry in enumerate(self.geometries):
             du_sub_values = du_values[geometry_indices == geometry_index]
 
             if len(du_sub_values) != 0:
-                v_values.append(geometry.u_v_from_u(du_sub_values)[:, 1])
-
-        local_coords = np.stack((u_array, np.concatenate(v_values)), axis=1)
+                v_end = v_start + len(du_sub_values)
+                local_coords[v_start:v_end, 1] = geometry.u_v_from_u(du_sub_values)[:, 1]
+                v_start = v_end
+        if v_start != len(u_array):
+            # Some u values lie before the start of the first geometry.
+            raise ValueError("Not all u values are covered by a geometry.")
 
         return local_coords
 
+    @cached_property
+    def _cubic_coefficients(self) -> Optional[np.ndarray]:
+        """Return the (a, b, c, d) coefficients of all geometries, [G, 4], or None if not all are cubic polynomials."""
+        if not all(isinstance(geometry, CubicPolynom) for geometry in self.geometries):
+            return None
+        return np.array([(geometry.a, geometry.b, geometry.c, geometry.d) for geometry in self.geometries])
+
     def global_coords_and_offsets_from_reference_line(
         self,
         distance_line: np.ndarray,
@@ -126,25 +157,20 @@ class MultiGeom:
             raise AssertionError("offset line length is 0")
         # First, partition the reference line into subsections that fit into each
         # distance range
-        distance_line_direction_vectors = np.diff(distance_line, axis=0)
-        distance_line_distances = np.cumsum(np.linalg.norm(distance_line_direction_vectors, axis=1))
+        # The direction vectors are written into a preallocated 3D array (for the cross product), instead of
+        # stacking them with the zero z values.
+        distance_line_direction_vectors = np.zeros((len(distance_line), 3))
+        np.subtract(distance_line[1:], distance_line[:-1], out=distance_line_direction_vectors[:-1, :2])
         # Make the distances the same length as the original reference line
         # We add a 0 to the start as "the distance to the 0th element is 0"
-        distance_line_distances = np.insert(distance_line_distances, 0, 0)
+        distance_line_distances = np.empty(len(distance_line))
+        distance_line_distances[0] = 0.0
+        np.cumsum(row_norms(distance_line_direction_vectors[:-1, :2]), out=distance_line_distances[1:])
         # Repeat the final direction vector to give this the same shape as the centre
         # line
         # We repeat the final vector at the end as the best guess we have for the
         # direction at the final coordinate is the preceding direction.
-        distance_line_direction_vectors = np.vstack(
-            (distance_line_direction_vectors, distance_line_direction_vectors[-1])
-        )
-        # Make 3D for cross product
-        distance_line_direction_vectors = np.vstack(
-            (
-                distance_line_direction_vectors.T,
-                np.zeros(len(distance_line_direction_vectors)).T,
-            )
-        ).T
+        distance_line_direction_vectors[-1] = distance_line_direction_vectors[-2]
         s_values = self.distance_array.copy()
         partition_indices = np.searchsorted(distance_line_distances, s_values)
 
@@ -153,7 +179,7 @@ class MultiGeom:
         if s_end is not None:
             filter_end_index = np.searchsorted(distance_line_distances, s_end, "right")
 
-        existing_offsets = np.linalg.norm(offset_line - reference_line, axis=1)
+        existing_offsets = row_norms(offset_line - reference_line)
 
         geometries = self.geometries
 
@@ -168,6 +194,9 @@ class MultiGeom:
             geometries = geometries + [NullGeometry()]
             s_values = np.append(s_values, s_values[-1])
 
+        # Collect the slices of the reference line covered by each geometry first, so that the v values of all
+        # slices can be evaluated at once.
+        slices = []
         start_end_indices = zip(partition_indices[:-1], partition_indices[1:])
         for (start_index, end_index), geometry, offset_distance in zip(start_end_indices, geometries, s_values):
             # Trying to allow sub geometries
@@ -177,27 +206,27 @@ class MultiGeom:
             start_index = max(filter_start_index, start_index)
 
             if start_index != end_index:  # Ignore empty slices (e.g. at the end)
-                sub_reference_line = reference_line[start_index:end_index]
-                sub_reference_line_direction_vectors = distance_line_direction_vectors[start_index:end_index]
-                sub_u_array = distance_line_distances[start_index:end_index]
-                sub_global_offsets = existing_offsets[start_index:end_index]
-                # Translate to start at 0
-                sub_u_array -= offset_distance
-
-                local_coords = geometry.u_v_from_u(sub_u_array)[:, 1] + sub_global_offsets
-
-                local_offsets = geometry.u_v_from_u(sub_u_array)[:, 1] + sub_global_offsets
-                all_local_offsets.append(local_offsets)
-
-                if len(local_coords) != 0:
-                    sub_global_coordinates = geometry.compute_offset_vectors(
-                        local_coords,
-                        sub_reference_line_direction_vectors,
-                        direction=direction,
-                    )
-                    global_coordinates.append(sub_reference_line + sub_global_coordinates)
-                else:
-                    global_coordinates.append(deepcopy(sub_reference_line))
+                slices.append((start_index, end_index, geometry, offset_distance))
+
+        for (start_index, end_index, geometry, _), v_values in zip(
+            slices, _evaluate_slices(slices, distance_line_distances)
+        ):
+            sub_reference_line = reference_line[start_index:end_index]
+            sub_reference_line_direction_vectors = distance_line_direction_vectors[start_index:end_index]
+            sub_global_offsets = existing_offsets[start_index:end_index]
+
+            local_offsets = v_values + sub_global_offsets
+            all_local_offsets.append(local_offsets)
+
+            if len(local_offsets) != 0:
+                sub_global_coordinates = geometry.compute_offset_vectors(
+                    local_offsets,
+                    sub_reference_line_direction_vectors,
+                    direction=direction,
+                )
+                global_coordinates.append(sub_reference_line + sub_global_coordinates)
+            else:
+                global_coordinates.append(deepcopy(sub_reference_line))
 
         if len(global_coordinates) == 0:
             # In case the requested range is too small, or outside of the geometry range
@@ -211,3 +240,46 @@ class MultiGeom:
         if s_start == 0 and s_end is None and len(all_local_offsets) != len(reference_line):
             raise AssertionError("array length mismatch")
         return global_coordinates, all_local_offsets
+
+
+def _evaluate_slices(
+    slices: List[Tuple[int, int, Geometry, float]], distance_line_distances: np.ndarray
+) -> List[np.ndarray]:
+    """Evaluate the v values of the geometries on their slices of the distance line.
+
+    Parameters
+    ----------
+    slices : List[Tuple[int, int, Geometry, float]]
+        The start index, end index, geometry and start distance of each slice.
+    distance_line_distances : np.ndarray
+        Distances along the distance line.
+
+    Returns:
+    -------
+    List[np.ndarray]
+        Array of v values for each slice, with u translated to start at 0 for every geometry.
+    """
+    # Translate to start at 0 for every geometry
+    u_arrays = [distance_line_distances[start_index:end_index] - offset for start_index, end_index, _, offset in slices]
+    if not all(isinstance(geometry, (CubicPolynom, NullGeometry)) for _, _, geometry, _ in slices):
+        return [geometry.u_v_from_u(u_array)[:, 1] for (_, _, geometry, _), u_array in zip(slices, u_arrays)]
+
+    if not slices:
+        return []
+
+    # Lane widths, lane borders and lane offsets are all cubic polynomials, so evaluate them in a single pass,
+    # with the coefficients of each slice repeated for every u value in it.
+    coefficients = np.array(
+        [
+            (geometry.a, geometry.b, geometry.c, geometry.d) if isinstance(geometry, CubicPolynom) else (0.0,) * 4
+            for _, _, geometry, _ in slices
+        ]
+    )
+    lengths = [len(u_array) for u_array in u_arrays]
+    if not coefficients[:, 1:].any():
+        # All slices have a constant width (or offset), so no u value has to be evaluated.
+        return np.split(np.repeat(coefficients[:, 0], lengths), np.cumsum(lengths)[:-1])
+    a, b, c, d = np.repeat(coefficients, lengths, axis=0).T
+    u_array = np.concatenate(u_arrays)
+    v_array = a + u_array * (b + u_array * (c + u_array * d))
+    return np.split(v_array, np.cumsum(lengths)[:-1])
@@ -48,11 +48,8 @@ class Junction:
         """
         _connecting_road_ids = set()
         for connection_attributes in self._connection_attributes_list:
-            try:
-                connecting_road_id = connection_attributes["connectingRoad"]
+            if (connecting_road_id := connection_attributes.get("connectingRoad")) is not None:
                 _connecting_road_ids.add(connecting_road_id)
-            except KeyError:
-                pass
 
         return _connecting_road_ids
 
@@ -68,11 +65,8 @@ class Junction:
         """
         _linked_road_ids = set()
         for connection_attributes in self._connection_attributes_list:
-            try:
-                linked_road_id = connection_attributes["linkedRoad"]
+            if (linked_road_id := connection_attributes.get("linkedRoad")) is not None:
                 _linked_road_ids.add(linked_road_id)
-            except KeyError:
-                pass
 
         return _linked_road_ids
 
@@ -13,9 +13,8 @@ except ImportError:
 
 import numpy as np
 from lxml import etree
-from odrviewer.pyxodr.enumerations import LaneChange, RoadMarkColor, RoadMarkType
+from odrviewer.pyxodr.enumerations import RoadMarkColor, RoadMarkType
 from odrviewer.pyxodr.geometries import CubicPolynom, MultiGeom
-from odrviewer.pyxodr.utils import cached_property
 
 
 class LaneOrientation(Enum):
@@ -64,12 +63,12 @@ class ConnectionPosition(Enum):
         ValueError
             If an unknown contact point string is passed in.
         """
-        if contact_point_str == "end":
-            return cls.END
-        elif contact_point_str == "start":
-            return cls.BEGINNING
-        else:
-            raise ValueError(f"Unknown contact point str {contact_point_str}: " + "expected 'end' or 'start'.")
+        try:
+            return _CONTACT_POINT_POSITIONS[contact_point_str]
+        except KeyError:
+            raise ValueError(
+                f"Unknown contact point str {contact_point_str}: " + "expected 'end' or 'start'."
+            ) from None
 
     @property
     def index(self):
@@ -77,16 +76,28 @@ class ConnectionPosition(Enum):
         return self.value
 
 
+# Marks a cached lane property that has not been computed yet (None is a valid value of some of them).
+_NOT_COMPUTED = object()
+
+# The connection positions of the OpenDRIVE e_contactPoint strings.
+_CONTACT_POINT_POSITIONS = {"start": ConnectionPosition.BEGINNING, "end": ConnectionPosition.END}
+
+
 @dataclass
 class RoadMark:
     """Stores a road marking OpenDRIVE attribute (e.g. a lane line or curb)."""
 
-    color: RoadMarkColor
+    # The plugin supports QGIS 3.30 (qgisMinimumVersion in metadata.txt), which ships with Python 3.9, so
+    # dataclass(slots=True) (Python 3.10) is not available and the slots are declared by hand. This works
+    # because none of the fields has a default value.
+    __slots__ = ("color", "height", "lane_change", "material", "s_offset", "type", "weight", "width")
+
+    color: str  # one of RoadMarkColor
     height: float | None
-    lane_change: LaneChange | None
+    lane_change: str | None  # one of LaneChange
     material: str | None
     s_offset: float
-    type: RoadMarkType
+    type: str  # one of RoadMarkType
     weight: float | None
     width: float | None
 
@@ -126,6 +137,35 @@ class Lane:
         line), by default None
     """
 
+    __slots__ = (
+        "road_id",
+        "lane_section_id",
+        "lane_xml",
+        "orientation",
+        "traffic_orientation",
+        "lane_offset_line",
+        "lane_section_reference_line",
+        "lane_z_coords",
+        "s_start",
+        "s_end",
+        "lane_reference_line",
+        "successor_data",
+        "predecessor_data",
+        "_id",
+        "_type",
+        "_uses_widths",
+        "_uses_borders",
+        "_width_coefficients",
+        "_width_geometry",
+        "_successor_ids",
+        "_predecessor_ids",
+        "_road_marks",
+        "_boundary_line",
+        "_centre_line",
+        "_traffic_flow_line",
+        "_traffic_flows_opposite",
+    )
+
     def __init__(
         self,
         road_id: int,
@@ -160,6 +200,35 @@ class Lane:
         self.successor_data: list[tuple[Lane, str]] = []
         self.predecessor_data: list[tuple[Lane, str]] = []
 
+        # Parse everything that is read from the XML element repeatedly (e.g. the widths, which are needed for
+        # the boundary and again for every road mark) only once.
+        self._id = int(lane_xml.attrib["id"])
+        lane_type = lane_xml.attrib["type"]
+        self._type = None if lane_type == "none" else lane_type
+
+        width_xmls = lane_xml.findall("width")
+        border_xmls = lane_xml.findall("border")
+        self._uses_widths = len(width_xmls) != 0
+        self._uses_borders = len(border_xmls) != 0
+        # Columns are (s, a, b, c, d) of each width (or border) polynomial.
+        self._width_coefficients = parse_polynomial_coefficients(width_xmls if self._uses_widths else border_xmls)
+        # Built on first use by get_boundary_line_segment, and reused for every road mark segment.
+        self._width_geometry = None
+
+        link_xml = lane_xml.find("link")
+        self._successor_ids = self._get_connecting_ids(link_xml, "successor")
+        self._predecessor_ids = self._get_connecting_ids(link_xml, "predecessor")
+
+        # Caches of road_marks, boundary_line and centre_line; cached_property needs an instance dict, which the
+        # slots remove.
+        self._road_marks = None
+        self._boundary_line = _NOT_COMPUTED
+        self._centre_line = None
+        self._traffic_flow_line = None
+
+        # Negative ID means to the right of the road reference line.
+        self._traffic_flows_opposite = (self._id < 0) != (traffic_orientation is TrafficOrientation.RIGHT)
+
     def __getitem__(self, name):
         """Returns a lane attribute, if set."""
         return self.lane_xml.attrib[name]
@@ -175,20 +244,21 @@ class Lane:
     @property
     def id(self):
         """Get the OpenDRIVE ID of this lane."""
-        return int(self["id"])
+        return self._id
 
     @property
     def successor_ids(self) -> list[int]:
         """Get the OpenDRIVE IDs of the successor lanes to this lane."""
-        return self._get_connecting_ids("successor")
+        return self._successor_ids
 
     @property
     def predecessor_ids(self) -> list[int]:
         """Get the OpenDRIVE IDs of the predecessor lanes to this lane."""
-        return self._get_connecting_ids("predecessor")
+        return self._predecessor_ids
 
-    def _get_connecting_ids(self, connecting_key: Literal["successor", "predecessor"]):
-        link_xml = self.lane_xml.find("link")
+    def _get_connecting_ids(
+        self, link_xml: etree._Element | None, connecting_key: Literal["successor", "predecessor"]
+    ) -> list[int]:
         if link_xml is None:
             return []
         # Note connections to and from lane ID 0 should not be allowed, therefore we
@@ -209,15 +279,12 @@ class Lane:
                 connecting_ids.append(int_id)
         return connecting_ids
 
-    @cached_property
+    @property
     def type(self) -> str:
         """Get the OpenDRIVE type of this lane."""
-        lane_type = self.lane_xml.attrib["type"]
-        if lane_type == "none":
-            lane_type = None
-        return lane_type
+        return self._type
 
-    @cached_property
+    @property
     def boundary_line(self) -> Optional[np.ndarray]:
         """Return the boundary line of this lane.
 
@@ -228,7 +295,9 @@ class Lane:
         np.ndarray
             Boundary of the far edge of the lane.
         """
-        return self.get_boundary_line_segment()
+        if self._boundary_line is _NOT_COMPUTED:
+            self._boundary_line = self.get_boundary_line_segment()
+        return self._boundary_line
 
     def get_boundary_line_segment(self, s_start=0.0, s_end=None) -> Optional[np.ndarray]:
         """Returns a subset of boundary geometry, based on a range for the 's' parameter."""
@@ -240,8 +309,8 @@ class Lane:
             # If there is a geometry, it must be valid.
             raise IndexError(f"Zero length reference line in lane {self}")
 
-        lane_uses_widths = self.lane_xml.findall("width") != []
-        lane_uses_borders = self.lane_xml.findall("border") != []
+        lane_uses_widths = self._uses_widths
+        lane_uses_borders = self._uses_borders
 
         if lane_uses_widths and lane_uses_borders:
             raise NotImplementedError(f"{self} seems to use both widths and borders; unsupported.")
@@ -252,23 +321,10 @@ class Lane:
                 f"{self} seems to use neither widths nor borders; unsupported " + "(for type!=none)."
             )
 
-        lane_geometries: list[CubicPolynom] = []
-        lane_distances: list[float] = []
-
-        for element in self.lane_xml.findall("width" if lane_uses_widths else "border"):
-            try:
-                s = float(element.attrib["s"])
-            except KeyError:
-                s = float(element.attrib["sOffset"])
-            a = float(element.attrib["a"])
-            b = float(element.attrib["b"])
-            c = float(element.attrib["c"])
-            d = float(element.attrib["d"])
-
-            lane_geometries.append(CubicPolynom(a, b, c, d))
-            lane_distances.append(s)
-
-        lane_multi_geometry = MultiGeom(lane_geometries, np.array(lane_distances))
+        if self._width_geometry is None:
+            lane_geometries = [CubicPolynom.get(a, b, c, d) for a, b, c, d in self._width_coefficients[:, 1:].tolist()]
+            self._width_geometry = MultiGeom(lane_geometries, self._width_coefficients[:, 0].copy())
+        lane_multi_geometry = self._width_geometry
         (
             global_lane_coords,
             _,
@@ -283,7 +339,7 @@ class Lane:
 
         return global_lane_coords
 
-    @cached_property
+    @property
     def centre_line(self) -> np.ndarray:
         """Return the centre line of this lane.
 
@@ -295,9 +351,15 @@ class Lane:
         np.ndarray
             Coordinates of the lane centre line.
         """
-        lane_centre_xy = np.mean((self.lane_reference_line, self.boundary_line), axis=0)
-        lane_centre = np.append(lane_centre_xy, self.lane_z_coords[:, np.newaxis], axis=1)
-        return lane_centre
+        if self._centre_line is None:
+            # Average the two lines directly into the output, instead of stacking them for np.mean and copying
+            # the result again with np.append.
+            lane_centre = np.empty((len(self.lane_reference_line), 3))
+            np.add(self.lane_reference_line, self.boundary_line, out=lane_centre[:, :2])
+            lane_centre[:, :2] *= 0.5
+            lane_centre[:, 2] = self.lane_z_coords
+            self._centre_line = lane_centre
+        return self._centre_line
 
     @property
     def _traffic_flows_in_opposite_direction_to_centre_line(self) -> bool:
@@ -311,11 +373,7 @@ class Lane:
         bool
             True if the traffic flows in the opposite direction to the centre line.
         """
-        # Negative ID means to the right of the road reference line.
-        traffic_flows_in_opposite_direction_to_centre_line = (self.id < 0) != (
-            self.traffic_orientation is TrafficOrientation.RIGHT
-        )
-        return traffic_flows_in_opposite_direction_to_centre_line
+        return self._traffic_flows_opposite
 
     @property
     def traffic_flow_line(self) -> np.ndarray:
@@ -326,12 +384,13 @@ class Lane:
         np.ndarray
             Coordinates of the centre line in the order of (legal) traffic flow.
         """
-        if self._traffic_flows_in_opposite_direction_to_centre_line:
-            traffic_flow_line = np.flip(self.centre_line, axis=0)
-        else:
-            traffic_flow_line = self.centre_line
+        if self._traffic_flow_line is None:
+            if self._traffic_flows_in_opposite_direction_to_centre_line:
+                self._traffic_flow_line = np.flip(self.centre_line, axis=0)
+            else:
+                self._traffic_flow_line = self.centre_line
 
-        return traffic_flow_line
+        return self._traffic_flow_line
 
     @property
     def traffic_flow_successors(self) -> set[Lane]:
@@ -366,18 +425,41 @@ class Lane:
     @property
     def road_marks(self) -> list[RoadMark]:
         """Returns the road marks associated to the lane. List is sorted by the `sOffset`."""
-        road_marks: list[RoadMark] = []
-        for road_mark_xml in self.lane_xml.findall("roadMark"):
-            road_marks.append(
-                RoadMark(
-                    color=road_mark_xml.get("color", RoadMarkColor.INVALID),
-                    height=float(road_mark_xml.get("height", 0.0)),
-                    lane_change=road_mark_xml.get("laneChange", None),
-                    material=road_mark_xml.get("material", None),
-                    s_offset=float(road_mark_xml.get("sOffset", 0.0)),
-                    type=road_mark_xml.get("type", RoadMarkType.INVALID),
-                    weight=road_mark_xml.get("weight", None),
-                    width=road_mark_xml.get("width", None),
-                )
+        # Parsed on first access only, as the road marks are not needed to build the lane geometries.
+        if self._road_marks is None:
+            self._road_marks = _parse_road_marks(self.lane_xml)
+        return self._road_marks
+
+
+def parse_polynomial_coefficients(polynomial_xmls: list[etree._Element]) -> np.ndarray:
+    """Parses the (s, a, b, c, d) coefficients of cubic polynomial elements into a [K, 5] array.
+
+    This applies to all elements that describe a cubic polynomial over s, e.g. `width`, `border`, `laneOffset`
+    and `elevation`. The start of the polynomial is read from `s`, or from `sOffset` if there is no `s`.
+    """
+    coefficients = []
+    for element in polynomial_xmls:
+        attrib = element.attrib
+        s = attrib["s"] if "s" in attrib else attrib["sOffset"]
+        coefficients.append((s, attrib["a"], attrib["b"], attrib["c"], attrib["d"]))
+    # Let NumPy convert all the attribute strings at once, instead of calling float() for each of them.
+    return np.array(coefficients, dtype=np.float64).reshape(-1, 5)
+
+
+def _parse_road_marks(lane_xml: etree._Element) -> list[RoadMark]:
+    """Parses the road marks of a lane, sorted by the `sOffset`."""
+    road_marks: list[RoadMark] = []
+    for road_mark_xml in lane_xml.iterfind("roadMark"):
+        road_marks.append(
+            RoadMark(
+                color=road_mark_xml.get("color", RoadMarkColor.INVALID),
+                height=float(road_mark_xml.get("height", 0.0)),
+                lane_change=road_mark_xml.get("laneChange", None),
+                material=road_mark_xml.get("material", None),
+                s_offset=float(road_mark_xml.get("sOffset", 0.0)),
+                type=road_mark_xml.get("type", RoadMarkType.INVALID),
+                weight=road_mark_xml.get("weight", None),
+                width=road_mark_xml.get("width", None),
             )
-        return sorted(road_marks, key=lambda x: x.s_offset)
+        )
+    return sorted(road_marks, key=lambda x: x.s_offset)
@@ -6,6 +6,7 @@ import numpy as np
 from lxml import etree
 from odrviewer.pyxodr.road_objects.lane import ConnectionPosition, Lane, LaneOrientation, TrafficOrientation
 from odrviewer.pyxodr.utils import cached_property
+from odrviewer.pyxodr.utils.array import boundaries_to_ring
 from shapely.geometry import Polygon
 
 
@@ -198,7 +199,7 @@ class LaneSection:
         right_border = self.lane_section_offset_line if self.right_lanes == [] else self.right_lanes[-1].boundary_line
         if left_border is None or right_border is None:
             return None
-        bounding_poly = Polygon(np.vstack((left_border, np.flip(right_border, axis=0))))
+        bounding_poly = Polygon(boundaries_to_ring(left_border, right_border))
 
         return bounding_poly
 
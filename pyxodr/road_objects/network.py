@@ -1,6 +1,6 @@
 """This file stores all functions related to loading an OpenDRIVE map file."""
 
-from typing import List, Optional, Set
+from typing import FrozenSet, List, Optional, Set
 
 from lxml import etree
 from odrviewer.pyxodr.road_objects.junction import Junction
@@ -31,7 +31,11 @@ class RoadNetwork:
         ignored_lane_types: Optional[Set[str]] = None,
     ):
         """Constructor to to build an OpenDRIVE map from an '*.xodr' file."""
-        self.tree = etree.parse(xodr_file_path)
+        # OpenDRIVE files do not need an ID table or the whitespace between the elements, and large maps may exceed
+        # lxml's default size limits. The parser is created for each file, as lxml parsers must not be shared between
+        # threads.
+        parser = etree.XMLParser(collect_ids=False, huge_tree=True, remove_blank_text=True, no_network=True)
+        self.tree = etree.parse(xodr_file_path, parser)
         self.root = self.tree.getroot()
 
         self.resolution = resolution
@@ -76,12 +80,13 @@ class RoadNetwork:
         return junctions
 
     @cached_property
-    def connecting_road_ids(self) -> Set[int]:
+    def connecting_road_ids(self) -> FrozenSet[str]:
         """Return the IDs of all connecting roads in all junctions in this network."""
         _connecting_road_ids = set()
         for junction in self.get_junctions():
             _connecting_road_ids |= junction.get_connecting_road_ids()
-        return _connecting_road_ids
+        # The set is cached and shared by all callers, so make it immutable.
+        return frozenset(_connecting_road_ids)
 
     def _link_roads(self):
         """Link all roads to their neighbours.
@@ -98,20 +103,18 @@ class RoadNetwork:
                 raise ValueError("Expected roads to link to only one other road")
             else:
                 link_xml = link_xmls[0]
-            pred_xmls = link_xml.findall("predecessor")
-            if pred_xmls == []:
-                pred_xml = None
-            elif len(pred_xmls) > 1:
-                raise ValueError("Expected roads to have only one predecessor road.")
-            else:
-                pred_xml = pred_xmls[0]
-            succ_xmls = link_xml.findall("successor")
-            if succ_xmls == []:
-                succ_xml = None
-            elif len(succ_xmls) > 1:
-                raise ValueError("Expected roads to have only one successor road.")
-            else:
-                succ_xml = succ_xmls[0]
+            # Find the predecessor and successor in a single pass over the children of the link element.
+            pred_xml = None
+            succ_xml = None
+            for neighbour_xml in link_xml:
+                if neighbour_xml.tag == "predecessor":
+                    if pred_xml is not None:
+                        raise ValueError("Expected roads to have only one predecessor road.")
+                    pred_xml = neighbour_xml
+                elif neighbour_xml.tag == "successor":
+                    if succ_xml is not None:
+                        raise ValueError("Expected roads to have only one successor road.")
+                    succ_xml = neighbour_xml
 
             pred_dict = pred_xml.attrib if pred_xml is not None else None
             succ_dict = succ_xml.attrib if succ_xml is not None else None
@@ -135,23 +138,21 @@ class RoadNetwork:
         verbose: bool = False,
     ) -> List[Road]:
         """Return the Road objects for all roads in this network."""
-        ids_to_avoid = self.connecting_road_ids if not include_connecting_roads else set()
+        ids_to_avoid = self.connecting_road_ids if not include_connecting_roads else frozenset()
         roads = []
-        iterator = self.root.findall("road")
-        for road_xml in iterator:
+        for road_xml in self.root.iterfind("road"):
             road_id = road_xml.attrib["id"]
             if road_id in ids_to_avoid:
                 continue
-            if road_id in self.road_ids_to_object:
-                roads.append(self.road_ids_to_object[road_id])
-            else:
+            road = self.road_ids_to_object.get(road_id)
+            if road is None:
                 road = Road(
                     road_xml,
                     resolution=self.resolution,
                     ignored_lane_types=self.ignored_lane_types,
                 )
                 self.road_ids_to_object[road.id] = road
-                roads.append(road)
+            roads.append(road)
 
         self._link_roads()
 
@@ -7,13 +7,23 @@ import numpy.typing as npt
 from lxml import etree
 from odrviewer.pyxodr.geometries import Arc, CubicPolynom, Line, MultiGeom, ParamCubicPolynom, Spiral
 from odrviewer.pyxodr.geometries.base import Geometry
-from odrviewer.pyxodr.road_objects.lane import ConnectionPosition, TrafficOrientation
+from odrviewer.pyxodr.road_objects.lane import ConnectionPosition, TrafficOrientation, parse_polynomial_coefficients
 from odrviewer.pyxodr.road_objects.lane_section import LaneSection
 from odrviewer.pyxodr.signals.signal import Signal
+from odrviewer.pyxodr.signals.signal_array import SignalArray
 from odrviewer.pyxodr.utils import cached_property
-from odrviewer.pyxodr.utils.array import interpolate_path
+from odrviewer.pyxodr.utils.array import boundaries_to_ring, interpolate_path, row_norms
 from shapely.geometry import Polygon
 
+# The paths to the child elements of a road are compiled once, instead of being parsed again on every lookup.
+_GEOMETRY_XPATH = etree.XPath("planView/geometry")
+_LANE_OFFSET_XPATH = etree.XPath("lanes/laneOffset")
+_ELEVATION_XPATH = etree.XPath("elevationProfile/elevation")
+_LANE_SECTION_XPATH = etree.XPath("lanes/laneSection")
+_SUCCESSOR_XPATH = etree.XPath("link/successor")
+_PREDECESSOR_XPATH = etree.XPath("link/predecessor")
+_SIGNAL_XPATH = etree.XPath("signals/signal")
+
 
 class Road:
     """Class representing a Road in an OpenDRIVE file.
@@ -40,6 +50,10 @@ class Road:
         self.road_xml = road_xml
         self.resolution = resolution
 
+        # The ID (and its hash) are read once, roads are hashed all the time when linking them in the network.
+        self._id = road_xml.attrib["id"]
+        self._hash = hash(self._id)
+
         self.ignored_lane_types = set() if ignored_lane_types is None else ignored_lane_types
 
         # We'll store both successor and predecessor data as sometimes one of these
@@ -66,10 +80,7 @@ class Road:
         ValueError
             If an unknown OpenDRIVE traffic orientation string is found.
         """
-        try:
-            xodr_str_traffic_orientation = self["rule"]
-        except KeyError:
-            xodr_str_traffic_orientation = "RHT"
+        xodr_str_traffic_orientation = self.road_xml.get("rule", "RHT")
         if xodr_str_traffic_orientation == "RHT":
             traffic_orientation = TrafficOrientation.RIGHT
         elif xodr_str_traffic_orientation == "LHT":
@@ -85,7 +96,7 @@ class Road:
 
     def __hash__(self):
         """Calculates a hash based on the road ID."""
-        return hash(self.id)
+        return self._hash
 
     def __repr__(self):
         """Returns a printable representation of the road ID."""
@@ -105,32 +116,42 @@ class Road:
         NotImplementedError
             If a geometry is encountered which is not implemented.
         """
-        geometry_coordinates = []
-        for geometry in self.reference_line_geometries:
-            geometry_coordinates.append(geometry.evaluate_geometry(self.resolution))
-
-        geometry_coordinates = np.array(geometry_coordinates, dtype=object)
-
-        stacked_coordinates = np.vstack(geometry_coordinates).astype(np.float64)
+        # Evaluate all geometries, and transform them to the global frame in one go.
+        stacked_coordinates = Geometry.evaluate_geometries(self.reference_line_geometries, self.resolution)
         stacked_coordinates = interpolate_path(stacked_coordinates, resolution=self.resolution)
 
         return stacked_coordinates
 
+    @cached_property
+    def reference_line_direction_vectors(self) -> np.ndarray:
+        """Return the direction vectors between consecutive points of the reference line."""
+        return np.diff(self.reference_line, axis=0)
+
+    @cached_property
+    def reference_line_distances(self) -> np.ndarray:
+        """Return the distance along the reference line, for each point of the reference line."""
+        distances = np.empty(len(self.reference_line))
+        distances[0] = 0.0
+        np.cumsum(row_norms(self.reference_line_direction_vectors), out=distances[1:])
+        return distances
+
     @cached_property
     def reference_line_geometries(self) -> list[Geometry]:
         """Returns all geometry segments within the centerline."""
-        geometry_element_distances = []
+        geometry_xmls = _GEOMETRY_XPATH(self.road_xml)
+        # Convert the attributes shared by all geometries with one NumPy call, instead of calling float() for each.
+        shared_attributes = np.array(
+            [[geometry.attrib[name] for name in ("length", "s", "x", "y", "hdg")] for geometry in geometry_xmls],
+            dtype=np.float64,
+        ).reshape(-1, 5)
+
         geometries: list[Geometry] = []
-        for geometry in self.road_xml.findall("planView/geometry"):
-            # Note this is the length of the element's reference line
-            length = float(geometry.attrib["length"])
-            distance_along_reference_line = float(geometry.attrib["s"])
-            x_global_offset = float(geometry.attrib["x"])
-            y_global_offset = float(geometry.attrib["y"])
-            heading_global_offset = float(geometry.attrib["hdg"])
-
-            geometry_element_distances.append(distance_along_reference_line)
-            if geometry.find("line") is not None:
+        for geometry, attributes in zip(geometry_xmls, shared_attributes.tolist()):
+            length, distance_along_reference_line, x_global_offset, y_global_offset, heading_global_offset = attributes
+            # Note length is the length of the element's reference line
+            # Look up the type of the geometry in a single pass over its children (the first one of each tag wins).
+            children = {child.tag: child for child in reversed(geometry)}
+            if "line" in children:
                 geometries.append(
                     Line(
                         x_offset=x_global_offset,
@@ -139,9 +160,8 @@ class Road:
                         length=length,
                     )
                 )
-            elif geometry.find("arc") is not None:
-                arc = geometry.find("arc")
-                curvature = float(arc.attrib["curvature"])
+            elif "arc" in children:
+                curvature = float(children["arc"].attrib["curvature"])
                 geometries.append(
                     Arc(
                         x_offset=x_global_offset,
@@ -151,12 +171,9 @@ class Road:
                         curvature=curvature,
                     )
                 )
-            elif geometry.find("poly3") is not None:
-                poly3 = geometry.find("poly3")
-                a = float(poly3.attrib["a"])
-                b = float(poly3.attrib["b"])
-                c = float(poly3.attrib["c"])
-                d = float(poly3.attrib["d"])
+            elif "poly3" in children:
+                poly3_attributes = children["poly3"].attrib
+                a, b, c, d = (float(poly3_attributes[name]) for name in ("a", "b", "c", "d"))
 
                 geometries.append(
                     CubicPolynom(
@@ -170,19 +187,12 @@ class Road:
                         length=length,
                     )
                 )
-            elif geometry.find("paramPoly3") is not None:
-                poly3 = geometry.find("paramPoly3")
-                a_u = float(poly3.attrib["aU"])
-                b_u = float(poly3.attrib["bU"])
-                c_u = float(poly3.attrib["cU"])
-                d_u = float(poly3.attrib["dU"])
-
-                a_v = float(poly3.attrib["aV"])
-                b_v = float(poly3.attrib["bV"])
-                c_v = float(poly3.attrib["cV"])
-                d_v = float(poly3.attrib["dV"])
-
-                p_range = poly3.attrib.get("pRange", "normalized")
+            elif "paramPoly3" in children:
+                poly3_attributes = children["paramPoly3"].attrib
+                a_u, b_u, c_u, d_u = (float(poly3_attributes[name]) for name in ("aU", "bU", "cU", "dU"))
+                a_v, b_v, c_v, d_v = (float(poly3_attributes[name]) for name in ("aV", "bV", "cV", "dV"))
+
+                p_range = poly3_attributes.get("pRange", "normalized")
                 upper_p = 1.0 if p_range == "normalized" else length
 
                 geometries.append(
@@ -201,12 +211,12 @@ class Road:
                         length=upper_p,
                     )
                 )
-            elif geometry.find("spiral") is not None:
-                spiral = geometry.find("spiral")
+            elif "spiral" in children:
+                spiral_attributes = children["spiral"].attrib
                 geometries.append(
                     Spiral(
-                        curv_start=float(spiral.attrib["curvStart"]),
-                        curv_end=float(spiral.attrib["curvEnd"]),
+                        curv_start=float(spiral_attributes["curvStart"]),
+                        curv_end=float(spiral_attributes["curvEnd"]),
                         x_offset=x_global_offset,
                         y_offset=y_global_offset,
                         heading_offset=heading_global_offset,
@@ -216,10 +226,11 @@ class Road:
             else:
                 raise NotImplementedError
 
-        geometry_element_distances = np.array(geometry_element_distances)
-
-        geometry_element_distances.argsort()
-        return geometries
+        # The reference line is built by joining the geometries in order, so sort them by their start along the
+        # reference line (files should already list them in that order). The sort is stable, so geometries with
+        # the same start keep the order of the file.
+        order = np.argsort(shared_attributes[:, 1], kind="stable")
+        return [geometries[i] for i in order]
 
     @cached_property
     def lane_offset_line(self) -> np.ndarray:
@@ -230,28 +241,15 @@ class Road:
         np.ndarray
             Lane offset line at resolution self.resolution
         """
-        lane_offsets = self.road_xml.findall("lanes/laneOffset")
+        lane_offsets = _LANE_OFFSET_XPATH(self.road_xml)
         if lane_offsets == []:
             lane_offset_coordinates = self.reference_line
         else:
-            offset_geometries = []
-            offset_distances = []
+            coefficients = parse_polynomial_coefficients(lane_offsets)
+            offset_geometries = [CubicPolynom.get(a, b, c, d) for a, b, c, d in coefficients[:, 1:].tolist()]
+            offset_distances = coefficients[:, 0]
 
-            for lane_offset in lane_offsets:
-                try:
-                    s = float(lane_offset.attrib["s"])
-                except KeyError:
-                    s = float(lane_offset.attrib["sOffset"])
-                offset_distances.append(s)
-
-                a = float(lane_offset.attrib["a"])
-                b = float(lane_offset.attrib["b"])
-                c = float(lane_offset.attrib["c"])
-                d = float(lane_offset.attrib["d"])
-
-                offset_geometries.append(CubicPolynom(a, b, c, d))
-
-            offset_multi_geometry = MultiGeom(offset_geometries, np.array(offset_distances))
+            offset_multi_geometry = MultiGeom(offset_geometries, offset_distances)
             # Appears that direction==left is the standard, negative t when on RHS
             (
                 lane_offset_coordinates,
@@ -275,32 +273,16 @@ class Road:
         np.ndarray
             Z coordinate, one per coordinate in self.reference_line
         """
-        reference_line_direction_vectors = np.diff(self.reference_line, axis=0)
-        reference_line_distances = np.cumsum(np.linalg.norm(reference_line_direction_vectors, axis=1))
-        reference_line_distances = np.append(np.array([0.0]), reference_line_distances)
-
-        elevation_profiles = self.road_xml.findall("elevationProfile/elevation")
-
-        offset_distances = []
+        reference_line_distances = self.reference_line_distances
 
-        offset_geometries = []
+        elevation_profiles = _ELEVATION_XPATH(self.road_xml)
 
-        for elevation_profile in elevation_profiles:
-            try:
-                s = float(elevation_profile.attrib["s"])
-            except KeyError:
-                s = float(elevation_profile.attrib["sOffset"])
-            offset_distances.append(s)
-
-            a = float(elevation_profile.attrib["a"])
-            b = float(elevation_profile.attrib["b"])
-            c = float(elevation_profile.attrib["c"])
-            d = float(elevation_profile.attrib["d"])
-
-            offset_geometries.append(CubicPolynom(a, b, c, d, 0.0, 0.0, 0.0))
+        coefficients = parse_polynomial_coefficients(elevation_profiles)
+        offset_geometries = [CubicPolynom.get(a, b, c, d) for a, b, c, d in coefficients[:, 1:].tolist()]
+        offset_distances = coefficients[:, 0]
 
         if offset_geometries != []:
-            elevation_multi_geometry = MultiGeom(offset_geometries, np.array(offset_distances))
+            elevation_multi_geometry = MultiGeom(offset_geometries, offset_distances)
 
             _, z_values = elevation_multi_geometry(reference_line_distances).T
         else:
@@ -311,7 +293,7 @@ class Road:
     @property
     def id(self):
         """Get the OpenDRIVE ID of this road."""
-        return self["id"]
+        return self._id
 
     def _link_lane_sections(self):
         """Connect all lane section objects within this road with their neighbours.
@@ -385,82 +367,85 @@ class Road:
 
     def __partition_lane_offset_line_into_lane_sections(
         self,
-    ) -> List[Tuple[etree._Element, np.ndarray, float, float]]:
-        lane_section_distances = []
-        for lane_section_xml in self.road_xml.findall("lanes/laneSection"):
-            lane_section_distances.append(float(lane_section_xml.attrib["s"]))
+    ) -> Tuple[
+        List[etree._Element],
+        List[Optional[np.ndarray]],
+        List[Optional[np.ndarray]],
+        List[Optional[np.ndarray]],
+        List[float],
+        List[float],
+    ]:
+        """Cut the lane offset line, z coordinates and reference line into the parts of each lane section.
+
+        Returns parallel lists (indexed by the lane section number) of the lane section XML elements, the sub
+        offset lines, sub z coordinates, sub reference lines, and the start and end distances of the lane sections.
+        """
+        lane_section_xmls = _LANE_SECTION_XPATH(self.road_xml)
 
         # Partition the reference line into subsections that fit into each
         # distance range
-        reference_line_direction_vectors = np.diff(self.reference_line, axis=0)
-        reference_line_distances = np.cumsum(np.linalg.norm(reference_line_direction_vectors, axis=1))
-        # Make the same length as the original reference line
-        reference_line_distances = np.insert(reference_line_distances, 0, 0)
+        reference_line_distances = self.reference_line_distances
         reference_line_length = np.sum(reference_line_distances[-1])
-        lane_section_distances.append(reference_line_length)
 
-        def get_sub_linestring(
-            linestring: npt.NDArray[np.float32], lengths: npt.NDArray[np.float32], start: float, end: float
-        ) -> Optional[npt.NDArray[np.float32]]:
-            if len(linestring) != len(lengths):
+        linestrings = (self.lane_offset_line, self.z_coordinates, self.reference_line)
+        for linestring in linestrings:
+            if len(linestring) != len(reference_line_distances):
                 raise AssertionError("the geometry and length arrays need to be of the same length")
-            if start >= end:
-                return None
-
-            # Find indices where the distances are greater than or equal to 'start' and less than or equal to 'end'.
-            start_idx = np.searchsorted(lengths, start, side="left")
-            end_idx = np.searchsorted(lengths, end, side="right")  # end_idx is not inclusive.
-            if start_idx == 0 and end_idx == len(lengths):
-                return linestring
-
-            # Handle cases where start_idx or end_idx might be out of bounds or exact matches are needed.
-            rel_tol = 1e-8
-            reuse_start_point = np.isclose(lengths[start_idx], start, atol=rel_tol) or start_idx == 0
-            reuse_end_point = np.isclose(lengths[end_idx - 1], end, atol=rel_tol) or end_idx == len(lengths)
-
-            def interpolate_point(exact_distance, distance_index):
-                interp_t = (exact_distance - lengths[distance_index - 1]) / (
-                    lengths[distance_index] - lengths[distance_index - 1]
-                )
-                return linestring[distance_index - 1] + interp_t * (
-                    linestring[distance_index] - linestring[distance_index - 1]
-                )
 
-            # Interpolate start point if needed (if the exact start point isn't at an existing node).
-            if not reuse_start_point:
-                start_point = interpolate_point(start, start_idx)
-                sub_linestring = [start_point] + list(linestring[start_idx + 1 : end_idx])
-            else:
-                sub_linestring = list(linestring[start_idx:end_idx])
-
-            # Interpolate the end point if needed (same approach as start).
-            if not reuse_end_point:
-                end_point = interpolate_point(end, end_idx)
-                sub_linestring.append(end_point)
-
-            if len(sub_linestring) < 2:
-                return None
-            return np.array(sub_linestring)
-
-        lane_section_tuples = []
-        for i, lane_section_xml in enumerate(self.road_xml.findall("lanes/laneSection")):
-            start_length = lane_section_distances[i]
-            end_length = lane_section_distances[i + 1]
-
-            if end_length > reference_line_length:
-                end_length = reference_line_length
-
-            lane_section_tuples.append(
-                (
-                    lane_section_xml,
-                    get_sub_linestring(self.lane_offset_line, reference_line_distances, start_length, end_length),
-                    get_sub_linestring(self.z_coordinates, reference_line_distances, start_length, end_length),
-                    get_sub_linestring(self.reference_line, reference_line_distances, start_length, end_length),
-                    start_length,
-                    end_length,
-                )
+        # Find the indices of the start and end of all lane sections at once. The start index is the first point
+        # at or after the start, the end index is one after the last point at or before the end.
+        lane_section_distances = np.array(
+            [lane_section_xml.attrib["s"] for lane_section_xml in lane_section_xmls] + [reference_line_length],
+            dtype=np.float64,
+        )
+        lane_section_starts = lane_section_distances[:-1]
+        lane_section_ends = np.minimum(lane_section_distances[1:], reference_line_length)
+        start_indices = np.searchsorted(reference_line_distances, lane_section_starts, side="left")
+        end_indices = np.searchsorted(reference_line_distances, lane_section_ends, side="right")
+
+        # Start and end points that (almost) coincide with a point of the reference line are reused, instead of
+        # being interpolated.
+        last_index = len(reference_line_distances) - 1
+        rel_tol = 1e-8
+        reuse_start_points = (start_indices == 0) | np.isclose(
+            reference_line_distances[np.minimum(start_indices, last_index)], lane_section_starts, atol=rel_tol
+        )
+        reuse_end_points = (end_indices == len(reference_line_distances)) | np.isclose(
+            reference_line_distances[np.maximum(end_indices - 1, 0)], lane_section_ends, atol=rel_tol
+        )
+
+        # The interpolation parameters of all start and end points, between the point before and the point at the
+        # found index. They are only used for the points that are not reused.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            start_ts = _interpolation_parameters(reference_line_distances, lane_section_starts, start_indices)
+            end_ts = _interpolation_parameters(reference_line_distances, lane_section_ends, end_indices)
+
+        sub_offset_lines, sub_z_coordinates, sub_reference_lines = [], [], []
+        for start, end, start_idx, end_idx, start_t, end_t in zip(
+            lane_section_starts.tolist(),
+            lane_section_ends.tolist(),
+            start_indices.tolist(),
+            end_indices.tolist(),
+            [None if reuse else t for reuse, t in zip(reuse_start_points.tolist(), start_ts.tolist())],
+            [None if reuse else t for reuse, t in zip(reuse_end_points.tolist(), end_ts.tolist())],
+        ):
+            # The offset line, z coordinates and reference line are cut at the same points, with the same
+            # interpolation parameters.
+            sub_offset_line, sub_z, sub_reference_line = _get_sub_linestrings(
+                linestrings, start, end, start_idx, end_idx, start_t, end_t
             )
-        return lane_section_tuples
+            sub_offset_lines.append(sub_offset_line)
+            sub_z_coordinates.append(sub_z)
+            sub_reference_lines.append(sub_reference_line)
+
+        return (
+            lane_section_xmls,
+            sub_offset_lines,
+            sub_z_coordinates,
+            sub_reference_lines,
+            lane_section_starts.tolist(),
+            lane_section_ends.tolist(),
+        )
 
     @cached_property
     def lane_sections(self) -> List[LaneSection]:
@@ -473,10 +458,14 @@ class Road:
             s direction)
         """
         lane_sections = []
-        for (
-            i,
-            (lane_section_xml, lane_sub_offset_line, lane_z_coordinates, lane_sub_reference_line, s_start, s_end),
-        ) in enumerate(self.__partition_lane_offset_line_into_lane_sections()):
+        for i, (
+            lane_section_xml,
+            lane_sub_offset_line,
+            lane_z_coordinates,
+            lane_sub_reference_line,
+            s_start,
+            s_end,
+        ) in enumerate(zip(*self.__partition_lane_offset_line_into_lane_sections())):
             lane_sections.append(
                 LaneSection(
                     self.id,
@@ -498,7 +487,7 @@ class Road:
     def successor_ids(self) -> Set[str]:
         """Get the OpenDRIVE IDs of the successor roads to this road."""
         _successor_ids = set()
-        for successor_xml in self.road_xml.find("link").findall("successor"):
+        for successor_xml in _SUCCESSOR_XPATH(self.road_xml):
             _successor_ids.add(successor_xml.attrib["elementId"])
         return _successor_ids
 
@@ -506,7 +495,7 @@ class Road:
     def predecessor_ids(self) -> Set[str]:
         """Get the OpenDRIVE IDs of the predecessor roads to this road."""
         _predecessor_ids = set()
-        for predecessor_xml in self.road_xml.find("link").findall("predecessor"):
+        for predecessor_xml in _PREDECESSOR_XPATH(self.road_xml):
             _predecessor_ids.add(predecessor_xml.attrib["elementId"])
         return _predecessor_ids
 
@@ -520,8 +509,8 @@ class Road:
         right_borders = self.lane_borders["right"]
         if right_borders == []:
             right_borders = [self.reference_line]
-        right_border = np.flip(right_borders[-1], axis=0)
-        bounding_poly = Polygon(np.vstack((left_border, right_border)))
+        right_border = right_borders[-1]
+        bounding_poly = Polygon(boundaries_to_ring(left_border, right_border))
 
         return bounding_poly
 
@@ -530,12 +519,12 @@ class Road:
         """Return the IDs of all junctions that connect to this road."""
         predecessor_junction_ids = [
             predecessor_xml.attrib["elementId"]
-            for predecessor_xml in self.road_xml.find("link").findall("predecessor")
+            for predecessor_xml in _PREDECESSOR_XPATH(self.road_xml)
             if predecessor_xml.attrib["elementType"] == "junction"
         ]
         successor_junction_ids = [
             successor_xml.attrib["elementId"]
-            for successor_xml in self.road_xml.find("link").findall("successor")
+            for successor_xml in _SUCCESSOR_XPATH(self.road_xml)
             if successor_xml.attrib["elementType"] == "junction"
         ]
 
@@ -546,25 +535,92 @@ class Road:
 
         return _junction_connecting_ids
 
-    @property
+    @cached_property
     def signals(self) -> list[Signal]:
-        """Returns the signals associated to the road."""
-        if (signals_node := self.road_xml.find("signals")) is not None:
-            return [Signal.from_xml_node(sig_node) for sig_node in signals_node.findall("signal")]
-        return []
+        """Returns the signals associated to the road.
+
+        The XML does not change after it is loaded, so the signals are only created once.
+        """
+        return Signal.from_xml_nodes(_SIGNAL_XPATH(self.road_xml))
+
+    @cached_property
+    def signal_array(self) -> SignalArray:
+        """Returns the signals associated to the road as NumPy columns, for vectorized queries."""
+        return SignalArray.from_xml_nodes(_SIGNAL_XPATH(self.road_xml))
 
     def get_coordinate_and_direction(self, s: float) -> tuple[npt.NDArray[np.float32], npt.NDArray[np.float32]]:
         """At a given s, returns the orientation of the reference line, and the direction vector."""
-        reference_line_direction_vectors = np.diff(self.reference_line, axis=0)
-        reference_line_distances = np.cumsum(np.linalg.norm(reference_line_direction_vectors, axis=1))
-        reference_line_distances = np.insert(reference_line_distances, 0, 0)
-        s_index = np.searchsorted(reference_line_distances, s)
-
-        if s_index >= len(self.reference_line):
-            s_index = len(self.reference_line) - 1
+        # Same as `get_coordinates_and_directions`, but with a scalar binary search instead of wrapping s in an array.
+        s_index = min(int(np.searchsorted(self.reference_line_distances, s)), len(self.reference_line) - 1)
+        dir_index = min(s_index, len(self.reference_line) - 2)
+        # Copy the rows, so that the cached reference line can not be modified through them.
+        return self.reference_line[s_index].copy(), self.reference_line_direction_vectors[dir_index].copy()
+
+    def get_coordinates_and_directions(
+        self, s_values: npt.NDArray[np.float64]
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Vectorized version of `get_coordinate_and_direction`, for an array of s values.
+
+        Returns the coordinates of the reference line at each s, and the (not normalized) direction vectors of the
+        reference line there, as two arrays with one row per s value.
+        """
+        s_indices = np.minimum(np.searchsorted(self.reference_line_distances, s_values), len(self.reference_line) - 1)
 
         # For the last point, use the previous direction vector
-        dir_index = s_index
-        if dir_index == len(self.reference_line) - 1:
-            dir_index -= 1
-        return self.reference_line[s_index], reference_line_direction_vectors[dir_index]
+        dir_indices = np.minimum(s_indices, len(self.reference_line) - 2)
+        return self.reference_line[s_indices], self.reference_line_direction_vectors[dir_indices]
+
+
+def _interpolation_parameters(lengths: np.ndarray, distances: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """Return where each distance lies between the lengths before and at its index (0 before, 1 at the index).
+
+    The indices are clipped to the valid range, the parameters of clipped indices are meaningless.
+    """
+    indices = np.clip(indices, 1, len(lengths) - 1)
+    previous_lengths = lengths[indices - 1]
+    return (distances - previous_lengths) / (lengths[indices] - previous_lengths)
+
+
+def _get_sub_linestrings(
+    linestrings: Tuple[np.ndarray, ...],
+    start: float,
+    end: float,
+    start_idx: int,
+    end_idx: int,
+    start_t: Optional[float],
+    end_t: Optional[float],
+) -> Tuple[Optional[np.ndarray], ...]:
+    """Cut the part between the distances `start` and `end` out of linestrings that share the same distances.
+
+    `start_idx` and `end_idx` are the results of searching `start` (left) and `end` (right) in the distances of the
+    linestrings. The start and end points are interpolated between the neighbouring points with the interpolation
+    parameters `start_t` and `end_t`, unless they are None, in which case the existing points are reused. Returns
+    None for each linestring if the part would have less than two points.
+    """
+    if start >= end:
+        return (None,) * len(linestrings)
+    reuse_start_point = start_t is None
+    reuse_end_point = end_t is None
+    if start_idx == 0 and end_idx == len(linestrings[0]):
+        return linestrings
+
+    # The points between the start and end point. If the start point is interpolated, it replaces the first point
+    # after the start.
+    first_idx = start_idx if reuse_start_point else start_idx + 1
+    num_points = len(range(first_idx, end_idx)) + (not reuse_start_point) + (not reuse_end_point)
+    if num_points < 2:
+        return (None,) * len(linestrings)
+
+    def interpolate_point(linestring, interp_t, distance_index):
+        previous_point = linestring[distance_index - 1 : distance_index]
+        return previous_point + interp_t * (linestring[distance_index : distance_index + 1] - previous_point)
+
+    sub_linestrings = []
+    for linestring in linestrings:
+        parts = [linestring[first_idx:end_idx]]
+        if not reuse_start_point:
+            parts.insert(0, interpolate_point(linestring, start_t, start_idx))
+        if not reuse_end_point:
+            parts.append(interpolate_point(linestring, end_t, end_idx))
+        sub_linestrings.append(np.concatenate(parts))
+    return tuple(sub_linestrings)
@@ -1,16 +1,41 @@
 """This file creates a model for traffic signal (i.e. signs and traffic lights)."""
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, Mapping, Optional
 
+import numpy as np
 from lxml.etree import _Element
-from odrviewer.pyxodr.enumerations import CountryCode, Orientation, Unit
+from odrviewer.pyxodr.enumerations import CountryCode
 
 
-@dataclass
+@dataclass(frozen=True)
 class Signal:
     """Represents a Signal according to OpenDRIVE 1.8.1 Specification."""
 
+    # Slots are declared by hand for the same reason as on `RoadMark` (pyxodr/road_objects/lane.py).
+    __slots__ = (
+        "country_revision",
+        "country",
+        "dynamic",
+        "h_offset",
+        "height",
+        "id",
+        "length",
+        "name",
+        "orientation",
+        "pitch",
+        "roll",
+        "s",
+        "subtype",
+        "t",
+        "text",
+        "type",
+        "unit",
+        "value",
+        "width",
+        "z_offset",
+    )
+
     country_revision: Optional[str]
     country: Optional[CountryCode]
     dynamic: bool
@@ -19,7 +44,7 @@ class Signal:
     id: str
     length: Optional[float]
     name: Optional[str]
-    orientation: Orientation
+    orientation: str  # one of Orientation
     pitch: Optional[float]
     roll: Optional[float]
     s: float
@@ -27,32 +52,72 @@ class Signal:
     t: float
     text: Optional[str]
     type: str
-    unit: Optional[Unit]
+    unit: Optional[str]  # one of Unit
     value: Optional[float]
     width: Optional[float]
     z_offset: float
 
-    def from_xml_node(self: _Element) -> "Signal":
-        """Loads a signal from an lxml node."""
-        return Signal(
-            country_revision=self.get("countryRevision", None),
-            country=self.get("country", None),
-            dynamic=self.get("dynamic", False),
-            h_offset=self.get("hOffset", None),
-            height=self.get("height", None),
-            id=self.get("id", "invalid_id"),
-            length=self.get("length", None),
-            name=self.get("name", None),
-            orientation=self.get("orientation", None),
-            pitch=self.get("pitch", None),
-            roll=self.get("roll", None),
-            s=float(self.get("s", 0.0)),
-            subtype=self.get("subtype", ""),
-            t=float(self.get("t", 0.0)),
-            text=self.get("text", None),
-            type=self.get("type", "none"),
-            unit=self.get("unit", None),
-            value=self.get("value", None),
-            width=self.get("width", None),
-            z_offset=float(self.get("zOffset", 0.0)),
+    def __getstate__(self) -> tuple:
+        """Returns the field values, frozen instances with slots can not be pickled otherwise."""
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        """Restores the field values of a pickled (or copied) signal."""
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_xml_node(cls, node: _Element) -> "Signal":
+        """Loads a signal from an lxml node.
+
+        The attributes are converted to the declared field types here, so that they are only parsed once.
+        """
+        return cls.from_xml_nodes([node])[0]
+
+    @classmethod
+    def from_xml_nodes(cls, nodes: Iterable[_Element]) -> list["Signal"]:
+        """Loads the signals from a sequence of lxml nodes.
+
+        The s, t and zOffset attributes of all signals are converted with a single NumPy call.
+        """
+        attributes = [node.attrib for node in nodes]
+        positions = np.array(
+            [(attrib.get("s", 0.0), attrib.get("t", 0.0), attrib.get("zOffset", 0.0)) for attrib in attributes],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+        return [
+            cls._from_attributes(attrib, s, t, z_offset)
+            for attrib, (s, t, z_offset) in zip(attributes, positions.tolist())
+        ]
+
+    @classmethod
+    def _from_attributes(cls, attributes: Mapping[str, str], s: float, t: float, z_offset: float) -> "Signal":
+        """Creates a signal from the XML attributes of a signal, and its already converted position."""
+        get = attributes.get
+        return cls(
+            country_revision=get("countryRevision"),
+            country=get("country"),
+            dynamic=get("dynamic", "no").lower() in ("yes", "true"),
+            h_offset=_optional_float(get("hOffset")),
+            height=_optional_float(get("height")),
+            id=get("id", "invalid_id"),
+            length=_optional_float(get("length")),
+            name=get("name"),
+            orientation=get("orientation"),
+            pitch=_optional_float(get("pitch")),
+            roll=_optional_float(get("roll")),
+            s=s,
+            subtype=get("subtype", ""),
+            t=t,
+            text=get("text"),
+            type=get("type", "none"),
+            unit=get("unit"),
+            value=_optional_float(get("value")),
+            width=_optional_float(get("width")),
+            z_offset=z_offset,
         )
+
+
+def _optional_float(value: Optional[str]) -> Optional[float]:
+    """Converts an optional XML attribute to a float, missing attributes stay None."""
+    return None if value is None else float(value)
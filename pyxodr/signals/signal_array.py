@@ -0,0 +1,81 @@
+"""This file creates a column-wise (structure of arrays) model for the traffic signals of a road."""
+
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+import numpy.typing as npt
+from lxml.etree import _Element
+
+# The float64 columns of SignalArray, with the XML attribute each one is read from, and its default value.
+# Missing attributes without a default are NaN.
+_FLOAT_COLUMNS: tuple[tuple[str, str, Optional[float]], ...] = (
+    ("s", "s", 0.0),
+    ("t", "t", 0.0),
+    ("z_offset", "zOffset", 0.0),
+    ("h_offset", "hOffset", None),
+    ("height", "height", None),
+    ("pitch", "pitch", None),
+    ("roll", "roll", None),
+    ("value", "value", None),
+    ("width", "width", None),
+)
+
+# The object (string) columns of SignalArray, with the XML attribute each one is read from, and its default value.
+_OBJECT_COLUMNS: tuple[tuple[str, str, Optional[str]], ...] = (
+    ("id", "id", "invalid_id"),
+    ("type", "type", "none"),
+    ("subtype", "subtype", ""),
+    ("name", "name", None),
+    ("text", "text", None),
+)
+
+
+@dataclass(frozen=True)
+class SignalArray:
+    """The numeric and identifying attributes of a sequence of signals, stored as one NumPy array per attribute.
+
+    Element i of each column belongs to the i-th signal. Missing optional numeric attributes are NaN.
+    """
+
+    s: npt.NDArray[np.float64]
+    t: npt.NDArray[np.float64]
+    z_offset: npt.NDArray[np.float64]
+    h_offset: npt.NDArray[np.float64]
+    height: npt.NDArray[np.float64]
+    pitch: npt.NDArray[np.float64]
+    roll: npt.NDArray[np.float64]
+    value: npt.NDArray[np.float64]
+    width: npt.NDArray[np.float64]
+    id: npt.NDArray[np.object_]
+    type: npt.NDArray[np.object_]
+    subtype: npt.NDArray[np.object_]
+    name: npt.NDArray[np.object_]
+    text: npt.NDArray[np.object_]
+
+    def __len__(self) -> int:
+        """Returns the number of signals."""
+        return len(self.s)
+
+    @classmethod
+    def from_xml_nodes(cls, nodes: Sequence[_Element]) -> "SignalArray":
+        """Loads the signal columns from a sequence of lxml nodes.
+
+        The columns are preallocated, and filled in a single pass over the attributes of the nodes. The defaults
+        are the same as in `Signal`.
+        """
+        float_columns = np.full((len(_FLOAT_COLUMNS), len(nodes)), np.nan)
+        object_columns = np.empty((len(_OBJECT_COLUMNS), len(nodes)), dtype=object)
+        for i, node in enumerate(nodes):
+            get = node.attrib.get
+            for column, (_, attribute, default) in enumerate(_FLOAT_COLUMNS):
+                value = get(attribute, default)
+                if value is not None:
+                    float_columns[column, i] = float(value)
+            for column, (_, attribute, default) in enumerate(_OBJECT_COLUMNS):
+                object_columns[column, i] = get(attribute, default)
+        # The rows of the column arrays are contiguous, so each field is a view of a single row.
+        return cls(
+            **{name: row for (name, _, _), row in zip(_FLOAT_COLUMNS, float_columns)},
+            **{name: row for (name, _, _), row in zip(_OBJECT_COLUMNS, object_columns)},
+        )
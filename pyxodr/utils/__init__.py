@@ -3,4 +3,4 @@
 from odrviewer.pyxodr.utils.array import interpolate_path
 from odrviewer.pyxodr.utils.cached_property import cached_property
 
-__all__ = [interpolate_path, cached_property]
+__all__ = ["interpolate_path", "cached_property"]
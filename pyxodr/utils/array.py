@@ -1,61 +1,80 @@
 """This file contains helper functions for arrays."""
 
 import numpy as np
-from scipy.interpolate import interp1d
 
 
 def fix_zero_directions(dirs: np.ndarray) -> np.ndarray:
     """Fix any zero rows by filling with adjacent elements.
 
-    Cycles through the array replacing any zero rows by
-    non-zero adjacent rows if they are there. Stops
-    when all rows are non-zero. If all elements are zero
-    then a ValueError is raised.
+    Replaces any zero rows by the nearest preceding non-zero row,
+    or, for zero rows at the start, by the first non-zero row.
+    If all elements are zero then a ValueError is raised.
     """
-    dirs = dirs.copy()
-    n = dirs.shape[0]
-    if (dirs == 0).all(1).sum() == 0:
-        return dirs
-    if (dirs == 0).all(1).sum() == n:
+    # A single reduction, without the temporary boolean array of `dirs == 0`.
+    zero_rows = ~dirs.any(axis=1)
+    if not zero_rows.any():
+        return dirs.copy()
+    if zero_rows.all():
         raise ValueError("All elements are zero.")
-    for _ in range(1, n - 1):  # will run in at most n - 1
-        for i in range(1, n - 1):
-            if (dirs[i] == 0).all():
-                if not (dirs[i - 1] == 0).all():
-                    dirs[i] = dirs[i - 1]
-                elif not (dirs[i + 1] == 0).all():
-                    dirs[i] = dirs[i + 1]
-        if (dirs[1:-1] == 0).all(1).sum() == 0:
-            break
-        for i in reversed(range(1, n - 1)):
-            if (dirs[i] == 0).all():
-                if not (dirs[i - 1] == 0).all():
-                    dirs[i] = dirs[i - 1]
-                elif not (dirs[i + 1] == 0).all():
-                    dirs[i] = dirs[i + 1]
-        if (dirs[1:-1] == 0).all(1).sum() == 0:
-            break
-    if (dirs[0] == 0).all():
-        dirs[0] = dirs[1]
-    if (dirs[-1] == 0).all():
-        dirs[-1] = dirs[-2]
-    return dirs
+
+    # Replace each zero row by the closest non-zero row before it (forward fill), and zero rows at the start,
+    # which have none, by the first non-zero row after them (backward fill).
+    n = dirs.shape[0]
+    row_indices = np.arange(n)
+    previous_non_zero = np.maximum.accumulate(np.where(zero_rows, -1, row_indices))
+    next_non_zero = np.minimum.accumulate(np.where(zero_rows, n, row_indices)[::-1])[::-1]
+    return dirs[np.where(previous_non_zero >= 0, previous_non_zero, next_non_zero)]
+
+
+def row_norms(vectors: np.ndarray) -> np.ndarray:
+    """Return the euclidean norm of each row of a [N, D] array.
+
+    Same as np.linalg.norm(vectors, axis=1), but einsum sums the squares without the temporary
+    array of squares and the generic dispatch of np.linalg.norm.
+    """
+    return np.sqrt(np.einsum("ij,ij->i", vectors, vectors))
+
+
+def boundaries_to_ring(first_boundary: np.ndarray, second_boundary: np.ndarray) -> np.ndarray:
+    """Join two boundary lines running in the same direction to a polygon ring.
+
+    The second boundary is appended in reverse. The reversed view is copied straight into the
+    preallocated ring, so unlike np.vstack((first, np.flip(second))) no temporary arrays are created.
+    """
+    n = len(first_boundary)
+    ring = np.empty((n + len(second_boundary), first_boundary.shape[1]), dtype=first_boundary.dtype)
+    ring[:n] = first_boundary
+    ring[n:] = second_boundary[::-1]
+    return ring
 
 
 def interpolate_path(path_vertices: np.ndarray, resolution: float = 0.1) -> np.ndarray:
     """Interpolate a path at the given resolution."""
-    # Remove duplicated points
-    _, idxs = np.unique(path_vertices, axis=0, return_index=True)
-    path_vertices = path_vertices[sorted(idxs)]
-    ss = np.hstack([[0.0], np.linalg.norm(np.diff(path_vertices, axis=0), axis=1).cumsum()])
-    interp_func = interp1d(
-        ss,
-        path_vertices,
-        axis=0,
-        fill_value="extrapolate",
-    )
-
-    new_distance = np.arange(0, ss[-1], resolution)
-    if len(new_distance) < 2:
-        new_distance = np.array([0.0, ss[-1]])
-    return interp_func(new_distance)
+    # Remove duplicated points. The path is a polyline, so only consecutive points can be duplicates (e.g. the
+    # shared end and start points of consecutive geometries). Duplicates are exactly equal, so the difference
+    # vectors of the remaining segments are the non-zero differences between the original points, and the
+    # differences are computed only once for both removing the duplicates and measuring the segments.
+    differences = np.diff(path_vertices, axis=0)
+    is_segment = differences.any(axis=1)
+    segments = differences[is_segment]
+    is_new_point = np.empty(len(path_vertices), dtype=bool)
+    is_new_point[0] = True
+    is_new_point[1:] = is_segment
+    path_vertices = path_vertices[is_new_point]
+    ss = np.empty(len(path_vertices))
+    ss[0] = 0.0
+    np.cumsum(row_norms(segments), out=ss[1:])
+    if len(ss) < 2:
+        raise ValueError("The path needs at least two distinct points to be interpolated.")
+
+    # Sample the whole path, including its end point, with the smallest number of points that keeps the spacing
+    # at or below the resolution.
+    new_distance = np.linspace(0.0, ss[-1], int(np.ceil(ss[-1] / resolution)) + 1)
+
+    # Linear interpolation between the vertices before and after each new distance. This is what
+    # scipy.interpolate.interp1d does (with the same arithmetic), without constructing an interpolator per path.
+    upper_indices = np.clip(np.searchsorted(ss, new_distance), 1, len(ss) - 1)
+    lower_indices = upper_indices - 1
+    lower_ss = ss[lower_indices]
+    slopes = segments[lower_indices] / (ss[upper_indices] - lower_ss)[:, np.newaxis]
+    return slopes * (new_distance - lower_ss)[:, np.newaxis] + path_vertices[lower_indices]
@@ -1,5 +1,7 @@
 """Apply QGIS rendering styles for the OpenDRIVE map."""
 
+from functools import lru_cache
+
 from odrviewer.model.qgis_odr_map import QGISOpenDriveMap
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QColor
@@ -23,82 +25,79 @@ def apply_qgis_styles(odr_map: QGISOpenDriveMap) -> None:
     apply_signal_layer_style(odr_map.signals)
 
 
+def clear_style_caches() -> None:
+    """Drops the cached style objects, which are built from the default symbols of the current project.
+
+    The plugin calls this whenever the project is cleared (e.g. before another project is opened), so that
+    the styles of the next project are created from its own default symbols.
+    """
+    _get_default_symbol_prototype.cache_clear()
+    _get_boundary_root_rule.cache_clear()
+    _get_signal_root_rule.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def _get_default_symbol_prototype(wkb_type: QgsWkbTypes.Type) -> QgsSymbol:
+    """Returns the default QGIS symbol for a geometry type, which is only created once per project.
+
+    The default symbols depend on the style settings of the project, see `clear_style_caches`. The prototype
+    must not be modified, the getters below return clones of it.
+    """
+    return QgsSymbol.defaultSymbol(QgsWkbTypes.geometryType(wkb_type))
+
+
 def get_default_polygon_symbol_type() -> QgsSymbol:
     """Returns the default QGIS symbol type for a polygon."""
-    return QgsSymbol.defaultSymbol(QgsWkbTypes.geometryType(QgsWkbTypes.Polygon))
+    return _get_default_symbol_prototype(QgsWkbTypes.Polygon).clone()
 
 
 def get_default_line_symbol_type() -> QgsSymbol:
     """Returns the default QGIS symbol type for a line."""
-    return QgsSymbol.defaultSymbol(QgsWkbTypes.geometryType(QgsWkbTypes.LineString))
+    return _get_default_symbol_prototype(QgsWkbTypes.LineString).clone()
 
 
 def get_default_point_symbol_type() -> QgsSymbol:
     """Returns the default QGIS symbol type for a point."""
-    return QgsSymbol.defaultSymbol(QgsWkbTypes.geometryType(QgsWkbTypes.Point))
+    return _get_default_symbol_prototype(QgsWkbTypes.Point).clone()
+
+
+def _get_arrow_style(arrow_color: QColor, width: float) -> QgsSymbol:
+    """Returns a line symbol with an arrow head at the last vertex, used for the reference frames and lines."""
+    symbol = get_default_line_symbol_type()
+    # Arrow stem (line)
+    line_symbol_layer = QgsSimpleLineSymbolLayer()
+    line_symbol_layer.setWidth(width)
+    line_symbol_layer.setColor(arrow_color)
+    symbol.changeSymbolLayer(0, line_symbol_layer)
+
+    # Arrow tip (small triangle)
+    marker_symbol_layer = QgsSimpleMarkerSymbolLayer()
+    marker_symbol_layer.setColor(arrow_color)
+    marker_symbol_layer.setStrokeColor(arrow_color)
+    marker_symbol_layer.setShape(Qgis.MarkerShape.ArrowHeadFilled)
+    marker_symbol_layer.setSize(2.0)
+    marker_symbol = QgsMarkerSymbol()
+    marker_symbol.changeSymbolLayer(0, marker_symbol_layer)
+
+    # Combine both
+    marker_layer = QgsMarkerLineSymbolLayer()
+    marker_layer.setSubSymbol(marker_symbol)
+    marker_layer.setPlacements(Qgis.MarkerLinePlacement.LastVertex)
+    symbol.appendSymbolLayer(marker_layer)
+    return symbol
 
 
 def apply_road_reference_frame_style(reference_frame_layer: QgsVectorLayer) -> None:
     """Applies a custom QGIS style for the reference frame vector layer."""
-
-    def get_arrow_style(arrow_color: QColor) -> QgsSymbol:
-        symbol = get_default_line_symbol_type()
-        # Arrow stem (line)
-        line_symbol_layer = QgsSimpleLineSymbolLayer()
-        line_symbol_layer.setWidth(0.20000)
-        line_symbol_layer.setColor(arrow_color)
-        symbol.changeSymbolLayer(0, line_symbol_layer)
-
-        # Arrow tip (small triangle)
-        marker_symbol_layer = QgsSimpleMarkerSymbolLayer()
-        marker_symbol_layer.setColor(arrow_color)
-        marker_symbol_layer.setStrokeColor(arrow_color)
-        marker_symbol_layer.setShape(Qgis.MarkerShape.ArrowHeadFilled)
-        marker_symbol_layer.setSize(2.0)
-        marker_symbol = QgsMarkerSymbol()
-        marker_symbol.changeSymbolLayer(0, marker_symbol_layer)
-
-        # Combine both
-        marker_layer = QgsMarkerLineSymbolLayer()
-        marker_layer.setSubSymbol(marker_symbol)
-        marker_layer.setPlacements(Qgis.MarkerLinePlacement.LastVertex)
-        symbol.appendSymbolLayer(marker_layer)
-        return symbol
-
     cat_renderer = QgsCategorizedSymbolRenderer("axis")
-    cat_renderer.addCategory(QgsRendererCategory("x", get_arrow_style(QColor.fromRgb(255, 0, 0)), "x"))
-    cat_renderer.addCategory(QgsRendererCategory("y", get_arrow_style(QColor.fromRgb(0, 255, 0)), "y"))
+    cat_renderer.addCategory(QgsRendererCategory("x", _get_arrow_style(QColor.fromRgb(255, 0, 0), 0.2), "x"))
+    cat_renderer.addCategory(QgsRendererCategory("y", _get_arrow_style(QColor.fromRgb(0, 255, 0), 0.2), "y"))
     reference_frame_layer.setRenderer(cat_renderer)
 
 
 def apply_road_reference_line_style(reference_line_layer: QgsVectorLayer) -> None:
     """Applies a custom QGIS style for the reference line vector layer."""
-
-    def get_arrow_style(arrow_color: QColor) -> QgsSymbol:
-        symbol = get_default_line_symbol_type()
-        # Arrow stem (line)
-        line_symbol_layer = QgsSimpleLineSymbolLayer()
-        line_symbol_layer.setWidth(0.30000)
-        line_symbol_layer.setColor(arrow_color)
-        symbol.changeSymbolLayer(0, line_symbol_layer)
-
-        # Arrow tip (small triangle)
-        marker_symbol_layer = QgsSimpleMarkerSymbolLayer()
-        marker_symbol_layer.setColor(arrow_color)
-        marker_symbol_layer.setStrokeColor(arrow_color)
-        marker_symbol_layer.setShape(Qgis.MarkerShape.ArrowHeadFilled)
-        marker_symbol_layer.setSize(2.0)
-        marker_symbol = QgsMarkerSymbol()
-        marker_symbol.changeSymbolLayer(0, marker_symbol_layer)
-
-        # Combine both
-        marker_layer = QgsMarkerLineSymbolLayer()
-        marker_layer.setSubSymbol(marker_symbol)
-        marker_layer.setPlacements(Qgis.MarkerLinePlacement.LastVertex)
-        symbol.appendSymbolLayer(marker_layer)
-        return symbol
-
-    reference_line_layer.setRenderer(QgsSingleSymbolRenderer(get_arrow_style(QColor(50, 50, 50))))
+    reference_line_layer.setRenderer(QgsSingleSymbolRenderer(_get_arrow_style(QColor(50, 50, 50), 0.3)))
 
 
 def apply_lane_polygon_style(lane_polygon_layer: QgsVectorLayer) -> None:
@@ -144,8 +143,13 @@ def apply_transition_style(transition_layer: QgsVectorLayer) -> None:
     transition_layer.setRenderer(QgsSingleSymbolRenderer(get_transition_style()))
 
 
-def apply_boundary_style(boundary_layer: QgsVectorLayer) -> None:
-    """Apply QGIS styling for the boundary geometries."""
+@lru_cache(maxsize=1)
+def _get_boundary_root_rule() -> QgsRuleBasedRenderer.Rule:
+    """Returns the root rule of the boundary renderer, which is only built once per project.
+
+    Its symbols are created from the default symbols of the project, see `clear_style_caches`. The rule
+    must not be modified, `apply_boundary_style` passes a clone of it to the renderer.
+    """
 
     def unknown_sym() -> QgsSymbol:
         symbol = get_default_line_symbol_type()
@@ -251,13 +255,23 @@ def apply_boundary_style(boundary_layer: QgsVectorLayer) -> None:
         )
     )
 
-    cat_renderer = QgsRuleBasedRenderer(root_rule)
+    return root_rule
+
+
+def apply_boundary_style(boundary_layer: QgsVectorLayer) -> None:
+    """Apply QGIS styling for the boundary geometries."""
+    cat_renderer = QgsRuleBasedRenderer(_get_boundary_root_rule().clone())
     boundary_layer.setRenderer(cat_renderer)
     boundary_layer.triggerRepaint()
 
 
-def apply_signal_layer_style(signal_point_layer: QgsVectorLayer) -> None:
-    """Applies a standardized rendering to the QGIS signal layer."""
+@lru_cache(maxsize=1)
+def _get_signal_root_rule() -> QgsRuleBasedRenderer.Rule:
+    """Returns the root rule of the signal renderer, which is only built once per project.
+
+    Its symbols are created from the default symbols of the project, see `clear_style_caches`. The rule
+    must not be modified, `apply_signal_layer_style` passes a clone of it to the renderer.
+    """
 
     def get_speed_limit_sign_style() -> QgsSymbol:
         symbol = get_default_point_symbol_type()
@@ -382,5 +396,10 @@ def apply_signal_layer_style(signal_point_layer: QgsVectorLayer) -> None:
         )
     )
 
-    cat_renderer = QgsRuleBasedRenderer(root_rule)
+    return root_rule
+
+
+def apply_signal_layer_style(signal_point_layer: QgsVectorLayer) -> None:
+    """Applies a standardized rendering to the QGIS signal layer."""
+    cat_renderer = QgsRuleBasedRenderer(_get_signal_root_rule().clone())
     signal_point_layer.setRenderer(cat_renderer)
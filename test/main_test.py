@@ -1,20 +1,62 @@
 """This file contains some test setup to be able to debug the code."""
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import numpy as np
 from odrviewer.converter.convert_odr_to_qgis import load_odr_map
+from odrviewer.pyxodr.geometries.cubic_polynom import CubicPolynom
 
 FIXTURE_DIR = Path(__file__).parent.parent.resolve()
 
+SAMPLE_FILES = ("Town03.xodr", "Town04.xodr", "Town05.xodr", "Town06.xodr")
+
+
+def _load_sample_file(filename: str) -> None:
+    """Loads a sample OpenDRIVE map (the QGIS layers can not be sent back to the test process)."""
+    load_odr_map(FIXTURE_DIR / "sample_files" / filename)
+
 
 def test_loading_sample_odr_file():
-    """This test case loads a sample OpenDRIVE map."""
-    load_odr_map(FIXTURE_DIR / "sample_files" / "Town03.xodr")
-    load_odr_map(FIXTURE_DIR / "sample_files" / "Town04.xodr")
-    load_odr_map(FIXTURE_DIR / "sample_files" / "Town05.xodr")
-    load_odr_map(FIXTURE_DIR / "sample_files" / "Town06.xodr")
+    """This test case loads the sample OpenDRIVE maps.
+
+    The maps are independent, so they are loaded in parallel worker processes.
+    """
+    with ProcessPoolExecutor(max_workers=min(len(SAMPLE_FILES), os.cpu_count() or 1)) as executor:
+        # Consume the results, so that errors in the workers are raised here.
+        list(executor.map(_load_sample_file, SAMPLE_FILES))
+
+
+def _exact_arc_length(u: float, b: float, c: float, d: float) -> float:
+    """Integrates the arc length of v(u) = a + bu + cu^2 + du^3 from 0 to u with 64-point Gauss-Legendre quadrature.
+
+    The integrand is smooth, so this agrees with scipy.integrate.quad to ~1e-11 m, without depending on SciPy.
+    """
+    nodes, weights = np.polynomial.legendre.leggauss(64)
+    x = 0.5 * u * (nodes + 1.0)
+    dv_du = b + x * (2.0 * c + x * (3.0 * d))
+    return 0.5 * u * float(np.sum(weights * np.sqrt(1.0 + dv_du * dv_du)))
+
+
+def test_cubic_polynom_arc_length():
+    """The sample maps contain no poly3 geometries, so this checks their arc length inversion numerically.
+
+    Each returned (u, v) point must lie on the polynomial, at the requested distance along the curve.
+    """
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        a, b, c, d = 0.3, rng.uniform(-0.5, 0.5), rng.uniform(-0.02, 0.02), rng.uniform(-3e-4, 3e-4)
+        length = rng.uniform(10.0, 150.0)
+        s_array = np.linspace(0.0, length, 37)
+        local_coords = CubicPolynom(a, b, c, d, length=length)(s_array)
+        u_array = local_coords[:, 0]
+        np.testing.assert_allclose(local_coords[:, 1], a + b * u_array + c * u_array**2 + d * u_array**3)
+        arc_lengths = [_exact_arc_length(u, b, c, d) for u in u_array]
+        np.testing.assert_allclose(arc_lengths, s_array, rtol=0.0, atol=2e-3)
 
 
 if __name__ == "__main__":
     """Helper `main` when running this file in the debugger."""
     test_loading_sample_odr_file()
+    test_cubic_polynom_arc_length()